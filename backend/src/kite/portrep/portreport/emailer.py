@@ -1,5 +1,7 @@
 # emailer.py
 import os
+import atexit
+import threading
 from email.message import EmailMessage
 import email.utils
 import smtplib
@@ -8,6 +10,43 @@ from xhtml2pdf import pisa
 
 from .mail_config import SMTP_HOST, SMTP_PORT, SMTP_USER, SMTP_PASS, MAIL_FROM
 
+# One logged-in SMTP connection reused across sends (SSL + auth handshake is the slow part)
+_smtp_conn = None
+_smtp_lock = threading.RLock()
+
+
+def get_smtp() -> smtplib.SMTP_SSL:
+    """Return a logged-in SMTP_SSL connection, reusing the previous one while it is alive."""
+    global _smtp_conn
+    with _smtp_lock:
+        if _smtp_conn is not None:
+            try:
+                _smtp_conn.noop()
+                return _smtp_conn
+            except (smtplib.SMTPException, OSError):
+                close_smtp()
+
+        conn = smtplib.SMTP_SSL(host=SMTP_HOST, port=SMTP_PORT)
+        if SMTP_USER and SMTP_PASS:
+            conn.login(SMTP_USER, SMTP_PASS)
+        _smtp_conn = conn
+        return conn
+
+
+def close_smtp():
+    """Close the shared SMTP connection (if any)."""
+    global _smtp_conn
+    with _smtp_lock:
+        if _smtp_conn is not None:
+            try:
+                _smtp_conn.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            _smtp_conn = None
+
+
+atexit.register(close_smtp)
+
 
 def convert_md_to_pdf(md_content: str, output_path: str):
     """Converts Markdown content to PDF and saves it."""
@@ -55,9 +94,11 @@ def send_email_with_attachment(to_addr: str, subject: str, body: str, attachment
         data = f.read()
     msg.add_attachment(data, maintype="application", subtype="pdf", filename=os.path.basename(attachment_path))
 
-    # SSL (465) is simplest for Gmail
-    with smtplib.SMTP_SSL(host=SMTP_HOST, port=SMTP_PORT) as s:
-        if SMTP_USER and SMTP_PASS:
-            s.login(SMTP_USER, SMTP_PASS)
-        s.send_message(msg)
+    # SSL (465) is simplest for Gmail; reconnect once if the server dropped us
+    with _smtp_lock:
+        try:
+            get_smtp().send_message(msg)
+        except smtplib.SMTPServerDisconnected:
+            close_smtp()
+            get_smtp().send_message(msg)
     print(f"✅ Email sent successfully to {to_addr}")
@@ -160,9 +160,16 @@
 import asyncio
 import os
 import json
-from datetime import datetime
+import mmap
+import time
+from pathlib import Path
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import existing agents
 from src.kite.mcpclient.kite_mcp_client import KiteMCPClient
 from src.kite.portbot.tool.portfolio import PortfolioAgent
@@ -172,71 +179,151 @@ from src.kite.portbot.tool.account import AccountAgent   # NEW
 load_dotenv(override=True)
 
 # ------------------ File Paths ------------------
-RAW_FILE = r"C:\Users\lenovo\OneDrive\Desktop\Hrishi\hacks\backend\KiteInfi\src\kite\portrep\portreport\mcp_raw_output.json"
-FINAL_FILE = r"C:\Users\lenovo\OneDrive\Desktop\Hrishi\hacks\backend\KiteInfi\src\kite\portrep\portreport\mcp_summary.json"
+SCRIPT_DIR = Path(__file__).parent
+RAW_FILE = Path(os.getenv("MCP_RAW_FILE", SCRIPT_DIR / "mcp_raw_output.json"))
+FINAL_FILE = Path(os.getenv("MCP_SUMMARY_FILE", SCRIPT_DIR / "mcp_summary.json"))
+
+# Raw dump is only a debugging artefact; set SAVE_MCP_RAW=0 to skip it
+SAVE_RAW = os.getenv("SAVE_MCP_RAW", "1").strip() == "1"
 
 # Temporary memory during single script execution
 RAW_OUTPUT = {}   # <- This replaces append mechanism
 
 
+# ------------------ JSON Helpers ------------------
+def _dumps(obj, indent=True):
+    """Serialize to JSON bytes (orjson when available); compact when indent=False."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _write_bytes(path, data):
+    """Write an encoded buffer straight to a file descriptor (no Python-level file object)."""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _loads(buf):
+    """Parse JSON bytes or a memoryview (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(buf)
+    return json.loads(bytes(buf))
+
+
+def _read_raw_file():
+    """Parse RAW_FILE through a read-only mmap instead of reading it into a buffer first."""
+    with open(RAW_FILE, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            return _loads(view)
+
+
+# ------------------ Row Schemas ------------------
+# (output key, source keys in priority order, decimal places or None)
+HOLDING_FIELDS = (
+    ("qty", ("quantity", "qty"), None),
+    ("avg", ("average_price", "avg"), 2),
+    ("ltp", ("last_price", "ltp"), 2),
+    ("pnl", ("pnl",), 2),
+)
+
+MF_FIELDS = (
+    ("units", ("units",), 3),
+    ("avg_nav", ("average_nav", "avg_nav"), 4),
+    ("nav", ("current_nav", "nav"), 4),
+    ("value", ("current_value", "value"), 2),
+    ("gain_pct", ("pnl_percentage", "gain_pct"), 2),
+)
+
+
+def _pick(d, keys, default=0):
+    """Return the first non-None value among keys (one lookup per key tried)."""
+    for key in keys:
+        value = d.get(key)
+        if value is not None:
+            return value
+    return default
+
+
+def _clean_row(row, fields):
+    """Resolve, coerce and round the numeric fields of one raw row in a single pass."""
+    out = {}
+    for key, sources, ndigits in fields:
+        value = float(_pick(row, sources))
+        # builtin round() on purpose: np.round scales first and moves half-way cases (2.675 -> 2.68)
+        out[key] = value if ndigits is None else round(value, ndigits)
+    return out
+
+
+def _clean_rows(rows, fields):
+    """Clean a whole section (one dict per raw row)."""
+    return [_clean_row(row, fields) for row in rows]
+
+
 # ------------------ Save RAW Data (Overwrite Once) ------------------
 def write_raw_file():
-    """Write RAW_OUTPUT dict to file (overwrite mode)"""
-    with open(RAW_FILE, "w") as f:
-        json.dump(RAW_OUTPUT, f, indent=4)
+    """Write RAW_OUTPUT dict to file (overwrite mode, compact JSON)"""
+    _write_bytes(RAW_FILE, _dumps(RAW_OUTPUT, indent=False))
     print(f"📁 Raw response stored (OVERWRITTEN) → {RAW_FILE}")
 
 
 # ------------------ Filter Final Data ------------------
-def filter_data():
+def build_summary(raw_dict):
+    """Pure transform: raw MCP payloads → final summary dict (no I/O)."""
+    # Validate presence of core API data
+    required = ["holdings", "mutual_funds", "profile"]
+    for key in required:
+        if key not in raw_dict:
+            raise ValueError(f"Missing required data → {key}")
+
+    # ---------------- HOLDINGS CLEANING ----------------
+    holdings = raw_dict["holdings"]["data"]
+    holdings = [
+        {"symbol": h.get("symbol") or h.get("tradingsymbol") or "UNKNOWN", **cleaned}
+        for h, cleaned in zip(holdings, _clean_rows(holdings, HOLDING_FIELDS))
+    ]
+
+    # ---------------- MUTUAL FUNDS CLEANING ----------------
+    mutual_funds = raw_dict["mutual_funds"]["data"]
+    mutual_funds = [
+        {"scheme_name": m.get("scheme_name", "MF_Symbol"), **cleaned}
+        for m, cleaned in zip(mutual_funds, _clean_rows(mutual_funds, MF_FIELDS))
+    ]
+
+    profile = raw_dict["profile"]["data"]
+    return {
+        "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "profile": {
+            "user_id": profile.get("user_id"),
+            "name": profile.get("user_name"),
+            "email": profile.get("email"),
+            "broker": profile.get("broker"),
+            "products": profile.get("products", []),
+            "exchanges": profile.get("exchanges", []),
+        },
+        "holdings": holdings,
+        "mutual_funds": mutual_funds,
+    }
+
+
+def filter_data(raw_dict=None):
+    """Build the final summary from raw_dict (re-read from RAW_FILE when None)."""
     try:
-        with open(RAW_FILE, "r") as f:
-            raw_dict = json.load(f)
-
-        # Validate presence of core API data
-        required = ["holdings", "mutual_funds", "profile"]
-        for key in required:
-            if key not in raw_dict:
-                raise ValueError(f"Missing required data → {key}")
-
-        final = {
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "profile": {
-                "user_id": raw_dict["profile"]["data"].get("user_id"),
-                "name": raw_dict["profile"]["data"].get("user_name"),
-                "email": raw_dict["profile"]["data"].get("email"),
-                "broker": raw_dict["profile"]["data"].get("broker"),
-                "products": raw_dict["profile"]["data"].get("products", []),
-                "exchanges": raw_dict["profile"]["data"].get("exchanges", []),
-            },
-            "holdings": [],
-            "mutual_funds": []
-        }
-
-        # ---------------- HOLDINGS CLEANING ----------------
-        for h in raw_dict["holdings"]["data"]:
-            final["holdings"].append({
-                "symbol": h.get("symbol") or h.get("tradingsymbol") or "UNKNOWN",
-                "qty": float(h.get("quantity", h.get("qty", 0))),
-                "avg": round(float(h.get("average_price", h.get("avg", 0))), 2),
-                "ltp": round(float(h.get("last_price", h.get("ltp", 0))), 2),
-                "pnl": round(float(h.get("pnl", 0)), 2),
-            })
-
-        # ---------------- MUTUAL FUNDS CLEANING ----------------
-        for m in raw_dict["mutual_funds"]["data"]:
-            final["mutual_funds"].append({
-                "scheme_name": m.get("scheme_name", "MF_Symbol"),
-                "units": round(float(m.get("units", 0)), 3),
-                "avg_nav": round(float(m.get("average_nav", m.get("avg_nav", 0))), 4),
-                "nav": round(float(m.get("current_nav", m.get("nav", 0))), 4),
-                "value": round(float(m.get("current_value", m.get("value", 0))), 2),
-                "gain_pct": round(float(m.get("pnl_percentage", m.get("gain_pct", 0))), 2),
-            })
+        if raw_dict is None:
+            raw_dict = _read_raw_file()
+
+        final = build_summary(raw_dict)
 
         # ---------------- WRITE FINAL FILE ----------------
-        with open(FINAL_FILE, "w") as f:
-            json.dump(final, f, indent=4)
+        _write_bytes(FINAL_FILE, _dumps(final))
 
         print(f"🎯 Final filtered summary stored → {FINAL_FILE}")
 
@@ -260,25 +347,30 @@ async def setup_agents():
     return PortfolioAgent(kite_client), AccountAgent(kite_client)
 
 
-async def test_and_save(label, func):
-    """Store result in RAW_OUTPUT dict (AND NOT APPEND TO FILE)"""
-    result = await func
-    RAW_OUTPUT[label] = result
-
-
 # ------------------ Main ------------------
 async def main():
     portfolio_agent, account_agent = await setup_agents()
     if portfolio_agent is None:
         return
 
-    # API calls — store in RAW_OUTPUT {}
-    await test_and_save("holdings", portfolio_agent._get_holdings())
-    await test_and_save("mutual_funds", portfolio_agent._get_mf_holdings())
-    await test_and_save("profile", account_agent.run("get_profile"))
-
-    write_raw_file()    # Write once — overwrite file
-    filter_data()       # Create final summary
+    # API calls — independent, so fetch concurrently and store in RAW_OUTPUT {}
+    labels = ("holdings", "mutual_funds", "profile")
+    results = await asyncio.gather(
+        portfolio_agent._get_holdings(),
+        portfolio_agent._get_mf_holdings(),
+        account_agent.run("get_profile"),
+        return_exceptions=True,
+    )
+    for label, result in zip(labels, results):
+        if isinstance(result, Exception):
+            result = {"status": "error", "message": f"Failed to fetch {label}: {result}", "data": [], "summary": None}
+        RAW_OUTPUT[label] = result
+
+    # Build final summary from memory; raw file (optional) is written alongside
+    jobs = [asyncio.to_thread(filter_data, RAW_OUTPUT)]
+    if SAVE_RAW:
+        jobs.append(asyncio.to_thread(write_raw_file))
+    await asyncio.gather(*jobs)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,11 @@
+import os
 import json
+import time
 import asyncio
+import hashlib
+import importlib.util
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 from src.kite.portrep.portreport.deepagent import DeepAgent
@@ -12,6 +17,17 @@ JSON_FILE = SCRIPT_DIR / "mcp_summary.json"
 REPORT_FILE = SCRIPT_DIR / "portfolio_report.html"
 CHARTS_DIR = SCRIPT_DIR / "viz" / "charts"
 
+# Max concurrent LLM analyses (keeps Groq/Tavily below their rate limits)
+LLM_CONCURRENCY = int(os.getenv("LLM_CONCURRENCY", "8"))
+
+# Per-asset LLM timeout (seconds) so one hung call can't stall the report
+LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", "120"))
+
+# Disk cache for per-asset analyses (seconds; 0 disables).
+# Kept under the git-ignored .cache/ — entries are analyses of the user's holdings.
+LLM_CACHE_DIR = SCRIPT_DIR / ".cache" / "llm"
+LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", "86400"))
+
 
 def format_currency(val):
     """Format value as Indian Rupee currency"""
@@ -648,8 +664,27 @@ def get_html_template():
 """
 
 
-def generate_html_content(data, analyses):
-    """Generate HTML content with professional styling"""
+@lru_cache(maxsize=1)
+def _template_parts():
+    """HTML template split once around {CONTENT} (head, tail)."""
+    head, tail = get_html_template().split("{CONTENT}")
+    return head, tail
+
+
+def _chart_src(filename, charts=None):
+    """<img> src for a chart: in-memory data URI when available, else the PNG on disk."""
+    if charts and filename in charts:
+        return f"data:image/png;base64,{charts[filename]}"
+    path = CHARTS_DIR / filename
+    return str(path.absolute()) if path.exists() else None
+
+
+def generate_html_content(data, analyses, charts=None):
+    """Generate HTML content with professional styling.
+
+    charts maps chart filenames to base64 PNGs from the chart generator; those
+    are embedded directly and only missing ones fall back to CHARTS_DIR.
+    """
     profile = data.get("profile", {})
     holdings = data.get("holdings", [])
     mfs = data.get("mutual_funds", [])
@@ -717,11 +752,11 @@ def generate_html_content(data, analyses):
         <p style="color: #64748b; margin-bottom: 20px;">Current Indian market overview with major indices performance and sentiment analysis.</p>
     '''
     
-    market_chart = CHARTS_DIR / "market_sentiment_dashboard.png"
-    if market_chart.exists():
+    market_chart = _chart_src("market_sentiment_dashboard.png", charts)
+    if market_chart:
         html += f'''
         <div class="chart-container">
-            <img src="{market_chart.absolute()}" alt="Market Sentiment Dashboard">
+            <img src="{market_chart}" alt="Market Sentiment Dashboard">
         </div>
         '''
     
@@ -764,13 +799,13 @@ def generate_html_content(data, analyses):
         </div>
     '''
     
-    portfolio_chart = CHARTS_DIR / "portfolio_performance_tracker.png"
-    if portfolio_chart.exists():
+    portfolio_chart = _chart_src("portfolio_performance_tracker.png", charts)
+    if portfolio_chart:
         html += f'''
         <div class="subsection-title">Portfolio Performance Chart</div>
         <p style="color: #64748b; margin-bottom: 15px;">Year-to-date performance tracking of your equity holdings with benchmark comparison.</p>
         <div class="chart-container">
-            <img src="{portfolio_chart.absolute()}" alt="Portfolio Performance Tracker">
+            <img src="{portfolio_chart}" alt="Portfolio Performance Tracker">
         </div>
         '''
     
@@ -852,11 +887,11 @@ def generate_html_content(data, analyses):
                 </div>
         '''
         
-        stock_chart = CHARTS_DIR / f"stock_analysis_{sym}.png"
-        if stock_chart.exists():
+        stock_chart = _chart_src(f"stock_analysis_{sym}.png", charts)
+        if stock_chart:
             html += f'''
                 <div class="chart-container">
-                    <img src="{stock_chart.absolute()}" alt="{sym} Technical Analysis">
+                    <img src="{stock_chart}" alt="{sym} Technical Analysis">
                 </div>
             '''
         
@@ -884,12 +919,12 @@ def generate_html_content(data, analyses):
     if not mfs:
         html += '<p style="color: #64748b;">No mutual fund holdings found.</p>'
     else:
-        mf_chart = CHARTS_DIR / "mf_performance_overview.png"
-        if mf_chart.exists():
+        mf_chart = _chart_src("mf_performance_overview.png", charts)
+        if mf_chart:
             html += f'''
             <div class="subsection-title">Performance Overview</div>
             <div class="chart-container">
-                <img src="{mf_chart.absolute()}" alt="Mutual Fund Performance Overview">
+                <img src="{mf_chart}" alt="Mutual Fund Performance Overview">
             </div>
             '''
         
@@ -943,50 +978,65 @@ def generate_html_content(data, analyses):
     return html
 
 
-def convert_html_to_pdf(html_content, pdf_path):
-    """Convert HTML to PDF using multiple methods"""
+def _pdf_xhtml2pdf(html_content, pdf_path):
+    from xhtml2pdf import pisa
     
-    # Method 1: Try xhtml2pdf (simplest, no external dependencies)
-    try:
-        from xhtml2pdf import pisa
-        
-        with open(pdf_path, "w+b") as pdf_file:
-            pisa_status = pisa.CreatePDF(html_content, dest=pdf_file)
-            
-        if not pisa_status.err:
-            print(f"✅ PDF generated successfully: {pdf_path}")
-            return True
-    except ImportError:
-        print("⚠️ xhtml2pdf not installed. Trying next method...")
-    except Exception as e:
-        print(f"⚠️ xhtml2pdf failed: {e}")
+    with open(pdf_path, "w+b") as pdf_file:
+        pisa_status = pisa.CreatePDF(html_content, dest=pdf_file)
+    return not pisa_status.err
+
+
+def _pdf_weasyprint(html_content, pdf_path):
+    from weasyprint import HTML
     
-    # Method 2: Try weasyprint
-    try:
-        from weasyprint import HTML, CSS
-        HTML(string=html_content).write_pdf(pdf_path)
-        print(f"✅ PDF generated successfully: {pdf_path}")
-        return True
-    except ImportError:
-        print("⚠️ weasyprint not installed. Trying next method...")
-    except Exception as e:
-        print(f"⚠️ weasyprint failed: {e}")
+    # Render straight from the in-memory string; base_url resolves relative assets
+    HTML(string=html_content, base_url=str(SCRIPT_DIR)).write_pdf(pdf_path)
+    return True
+
+
+def _pdf_pdfkit(html_content, pdf_path):
+    import pdfkit
     
-    # Method 3: Try pdfkit
-    try:
-        import pdfkit
-        options = {
-            'encoding': 'UTF-8',
-            'enable-local-file-access': None,
-            'quiet': ''
-        }
-        pdfkit.from_string(html_content, pdf_path, options=options)
-        print(f"✅ PDF generated successfully: {pdf_path}")
-        return True
-    except ImportError:
-        print("⚠️ pdfkit not installed.")
-    except Exception as e:
-        print(f"⚠️ pdfkit failed: {e}")
+    options = {
+        'encoding': 'UTF-8',
+        'enable-local-file-access': None,
+        'quiet': ''
+    }
+    pdfkit.from_string(html_content, pdf_path, options=options)
+    return True
+
+
+# (name, module, converter) in order of preference:
+# 1. xhtml2pdf (simplest, no external dependencies), 2. weasyprint, 3. pdfkit
+PDF_BACKENDS = (
+    ("xhtml2pdf", "xhtml2pdf", _pdf_xhtml2pdf),
+    ("weasyprint", "weasyprint", _pdf_weasyprint),
+    ("pdfkit", "pdfkit", _pdf_pdfkit),
+)
+
+
+@lru_cache(maxsize=1)
+def _available_pdf_backends():
+    """Probe once which PDF libraries are installed (without importing them)."""
+    available = []
+    for name, module, convert in PDF_BACKENDS:
+        if importlib.util.find_spec(module) is not None:
+            available.append((name, convert))
+        else:
+            print(f"⚠️ {name} not installed.")
+    return tuple(available)
+
+
+def convert_html_to_pdf(html_content, pdf_path):
+    """Convert HTML to PDF using the first installed backend that succeeds"""
+    
+    for name, convert in _available_pdf_backends():
+        try:
+            if convert(html_content, pdf_path):
+                print(f"✅ PDF generated successfully: {pdf_path}")
+                return True
+        except Exception as e:
+            print(f"⚠️ {name} failed: {e}")
     
     # All methods failed
     print("\n" + "="*60)
@@ -1007,70 +1057,120 @@ def convert_html_to_pdf(html_content, pdf_path):
     return False
 
 
-async def main_async():
-    """Main async function - generates report from existing data."""
-    print("🚀 Creating Professional Portfolio Report...")
-    
-    # Load Data
-    data = load_data()
-    if not data:
-        print("\n❌ FAILED: Could not load portfolio data")
-        return
+def _cached_analyze_asset(agent, name, kind, details):
+    """agent.analyze_asset memoized on disk by (kind, name, details) for LLM_CACHE_TTL seconds."""
+    if LLM_CACHE_TTL <= 0:
+        return agent.analyze_asset(name, kind, details)
+
+    key = hashlib.blake2b(f"{kind}|{name}|{details}".encode("utf-8"), digest_size=16).hexdigest()
+    path = LLM_CACHE_DIR / f"{key}.txt"
+    try:
+        if time.time() - path.stat().st_mtime < LLM_CACHE_TTL:
+            return path.read_text(encoding="utf-8")
+    except OSError:
+        pass
+
+    result = agent.analyze_asset(name, kind, details)
+    # Never cache failures — they should be retried on the next run
+    if result and not result.startswith(("Error", "No search results")):
+        LLM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        path.write_text(result, encoding="utf-8")
+    return result
+
 
+async def _analyze(agent, sem, key, name, kind, details):
+    """Run one blocking analyze_asset call in a worker thread, bounded by sem and LLM_TIMEOUT.
+
+    Never raises, so one failure can't abort the gather in analyze_all.
+
+    LLM_TIMEOUT only stops *waiting*: the worker thread can't be cancelled, so a hung
+    call keeps its thread (outside the semaphore), may still write the disk cache when
+    it finally returns, and asyncio.run waits for it at shutdown.
+    """
+    try:
+        async with sem:
+            print(f"   - Analyzing {name[:30]}...")
+            return key, await asyncio.wait_for(
+                asyncio.to_thread(_cached_analyze_asset, agent, name, kind, details),
+                timeout=LLM_TIMEOUT,
+            )
+    except asyncio.TimeoutError:
+        print(f"     ⏱️ Timed out after {LLM_TIMEOUT:.0f}s: {name[:30]}")
+        return key, f"Error analyzing {name}: timed out after {LLM_TIMEOUT:.0f}s"
+    except Exception as e:
+        print(f"     ❌ Failed: {e}")
+        return key, f"Error analyzing {name}: {str(e)}"
+
+
+async def analyze_all(data):
+    """Run the LLM analysis for every holding and mutual fund concurrently."""
     agent = DeepAgent()
-    analyses = {}
+    sem = asyncio.Semaphore(LLM_CONCURRENCY)
+    jobs = []  # (key, name, kind, details)
 
     # Analyze Stocks
-    print("\n📦 Analyzing Equity Holdings...")
     for h in data.get("holdings", []):
         sym = h["symbol"]
         details = (
             f"Quantity: {h['qty']}, Average Price: ₹{h['avg']}, "
             f"Current Price: ₹{h['ltp']}, Total P&L: ₹{h['pnl']}"
         )
-
-        print(f"   - Analyzing {sym}...")
-        try:
-            analyses[f"STOCK_{sym}"] = agent.analyze_asset(sym, "Stock", details)
-        except Exception as e:
-            print(f"     ❌ Failed: {e}")
-            analyses[f"STOCK_{sym}"] = f"Error analyzing {sym}: {str(e)}"
+        jobs.append((f"STOCK_{sym}", sym, "Stock", details))
 
     # Analyze Mutual Funds
-    print("\n🏦 Analyzing Mutual Funds...")
-    mfs = data.get("mutual_funds", [])
-
-    for m in mfs:
+    for m in data.get("mutual_funds", []):
         scheme_name = m["scheme_name"]
         details = (
             f"Units: {m['units']}, NAV: ₹{m['nav']}, "
             f"Current Value: ₹{m['value']}, Gain: {m['gain_pct']}%"
         )
+        jobs.append((f"MF_{scheme_name}", scheme_name, "Mutual Fund", details))
 
-        print(f"   - Analyzing {scheme_name[:30]}...")
-        try:
-            analyses[f"MF_{scheme_name}"] = agent.analyze_asset(scheme_name, "Mutual Fund", details)
-        except Exception as e:
-            print(f"     ❌ Failed: {e}")
-            analyses[f"MF_{scheme_name}"] = f"Error analyzing {scheme_name}: {str(e)}"
+    # All LLM calls are independent — run them concurrently
+    print("\n📦 Analyzing Equity Holdings & Mutual Funds...")
+    results = await asyncio.gather(*(_analyze(agent, sem, *job) for job in jobs))
+    return dict(results)
+
+
+async def main_async(data=None, analyses=None, charts=None):
+    """Main async function - generates report from existing data.
+
+    Callers that already loaded/analysed the portfolio (e.g. overlapped with
+    chart generation) can pass data and analyses to skip those steps, and the
+    generator's in-memory charts to embed them as data URIs.
+    """
+    print("🚀 Creating Professional Portfolio Report...")
+    
+    # Load Data
+    if data is None:
+        data = load_data()
+    if not data:
+        print("\n❌ FAILED: Could not load portfolio data")
+        return
+
+    if analyses is None:
+        analyses = await analyze_all(data)
 
     # Generate HTML Report
     print("\n📝 Compiling Professional Report...")
-    html_content = generate_html_content(data, analyses)
-    full_html = get_html_template().replace("{CONTENT}", html_content)
+    # Rendering is synchronous (and carries the inlined chart PNGs) — keep it off the event loop
+    html_content = await asyncio.to_thread(generate_html_content, data, analyses, charts)
+    head, tail = _template_parts()
+    full_html = head + html_content + tail
 
-    # Save HTML Report
-    with open(REPORT_FILE, "w", encoding="utf-8") as f:
-        f.write(full_html)
+    # Convert to PDF from memory; the HTML copy is saved alongside (off the event loop)
+    pdf_file = str(REPORT_FILE).replace(".html", ".pdf")
+    _, pdf_ok = await asyncio.gather(
+        asyncio.to_thread(REPORT_FILE.write_text, full_html, encoding="utf-8"),
+        asyncio.to_thread(convert_html_to_pdf, full_html, pdf_file),
+    )
 
     print(f"\n✅ HTML Report generated: {REPORT_FILE}")
 
-    # Convert to PDF and Email
+    # Email
     print("\n📧 Preparing Email...")
     try:
-        pdf_file = str(REPORT_FILE).replace(".html", ".pdf")
-        
-        if convert_html_to_pdf(full_html, pdf_file):
+        if pdf_ok:
             user_email = data.get("profile", {}).get("email")
             if user_email:
                 print(f"   - Sending to: {user_email}")
@@ -10,6 +10,12 @@ This script:
 
 Usage:
     python run_portfolio_report.py
+
+Environment:
+    LLM_CONCURRENCY  Max concurrent per-asset LLM analyses (default: 8)
+    LLM_TIMEOUT      Seconds to wait on a single LLM analysis before giving up on it (default: 120;
+                     the call itself keeps running in its worker thread)
+    LLM_CACHE_TTL    Seconds to reuse cached per-asset analyses (default: 86400, 0 disables)
 """
 
 import asyncio
@@ -22,8 +28,6 @@ from datetime import datetime
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from src.kite.portrep.portreport.viz.generate_charts import PortfolioChartGenerator
-
 
 async def fetch_portfolio_data():
     """Step 1: Login to Kite and fetch portfolio data."""
@@ -45,36 +49,58 @@ async def fetch_portfolio_data():
 
 
 def generate_charts():
-    """Step 2: Generate market and stock charts."""
+    """Step 2: Generate market and stock charts.
+
+    Returns the generated charts as {filename: base64 PNG} (empty on failure).
+    """
     print("\n" + "="*60)
     print("STEP 2: GENERATING CHARTS")
     print("="*60)
     
     try:
+        # Imported here so plotly/pandas/yfinance only load when charts are built
+        from src.kite.portrep.portreport.viz.generate_charts import PortfolioChartGenerator
+        
         script_dir = Path(__file__).parent
         json_path = script_dir / "mcp_summary.json"
         output_dir = script_dir / "viz" / "charts"
         
         if not json_path.exists():
             print(f"❌ Error: {json_path} not found!")
-            return False
+            return {}
         
         generator = PortfolioChartGenerator(json_path, output_dir)
         charts = generator.generate_all_charts()
         
         if charts:
             print(f"✅ Generated {len(charts)} charts successfully")
-            return True
+            return generator.encoded_charts
         else:
             print("⚠️ No charts were generated")
-            return False
+            return {}
             
     except Exception as e:
         print(f"❌ Failed to generate charts: {e}")
-        return False
+        return {}
+
+
+async def analyze_portfolio():
+    """Step 2b: Run per-asset LLM analysis (overlaps with chart generation)."""
+    try:
+        from src.kite.portrep.portreport.generate_report import load_data, analyze_all
+
+        data = load_data()
+        if not data:
+            return None, None
+
+        print("🧠 Analyzing holdings and mutual funds...")
+        return data, await analyze_all(data)
+    except Exception as e:
+        print(f"❌ Failed to analyze portfolio: {e}")
+        return None, None
 
 
-async def generate_report():
+async def generate_report(data=None, analyses=None, charts=None):
     """Step 3: Generate PDF report with charts."""
     print("\n" + "="*60)
     print("STEP 3: GENERATING REPORT")
@@ -85,7 +111,7 @@ async def generate_report():
         from src.kite.portrep.portreport.generate_report import main_async as create_report
         
         print("📝 Creating portfolio report with charts...")
-        await create_report()
+        await create_report(data, analyses, charts)
         print("✅ Report generated and emailed successfully")
         return True
     except Exception as e:
@@ -109,13 +135,17 @@ async def main():
         print("Please check your Kite credentials and try again.")
         return
     
-    # Step 2: Generate charts
-    if not generate_charts():
+    # Step 2: Generate charts (Yahoo Finance I/O) while the LLM analyses run
+    charts, (data, analyses) = await asyncio.gather(
+        asyncio.to_thread(generate_charts),
+        analyze_portfolio(),
+    )
+    if not charts:
         print("\n⚠️ WARNING: Chart generation failed")
         print("Continuing with report generation (without charts)...")
     
     # Step 3: Generate and email report
-    if not await generate_report():
+    if not await generate_report(data, analyses, charts):
         print("\n❌ FAILED: Could not generate report")
         return
     
@@ -6,16 +6,25 @@ Reads mcp_summary.json and generates charts based on actual portfolio holdings.
 import os
 import json
 import base64
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import visualization classes
 import sys
 sys.path.append(os.path.dirname(__file__))
 
-from port_viz import PortfolioVisualizer
+from port_viz import PortfolioVisualizer, fetch_history, warm_up_renderer
 from sysmbol_utils import normalize_symbol
-from mf_viz import MutualFundVisualizer
+
+
+# Indian market indices for the sentiment dashboard
+MARKET_INDICES = ['^NSEI', '^BSESN', '^NSEBANK', '^NSEMDCP50', '^INDIAVIX']
 
 
 class PortfolioChartGenerator:
@@ -31,15 +40,31 @@ class PortfolioChartGenerator:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Load portfolio data
-        with open(json_path, 'r') as f:
-            self.data = json.load(f)
+        # Load portfolio data (orjson when available)
+        with open(json_path, 'rb') as f:
+            raw = f.read()
+        self.data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         
         self.viz = PortfolioVisualizer()
         self.generated_charts = []
+        self.encoded_charts = {}  # filename -> base64 PNG, for embedding as data URIs
+        self._price_cache = None
+    
+    def get_price_history(self):
+        """Fetch YTD/6-month history for all indices and holdings in one batch (cached)."""
+        if self._price_cache is None:
+            symbols = MARKET_INDICES + [normalize_symbol(h['symbol']) for h in self.data.get('holdings', [])]
+            end_date = datetime.now()
+            start_date = min(datetime(end_date.year, 1, 1), end_date - timedelta(days=180))
+            try:
+                self._price_cache = fetch_history(symbols, start=start_date, end=end_date)
+            except Exception as e:
+                print(f"⚠️ Batch price download failed, falling back to per-symbol fetches: {e}")
+                self._price_cache = {}
+        return self._price_cache
     
     def save_base64_image(self, encoded_str, filename):
-        """Save base64 encoded image to file."""
+        """Save base64 encoded image to file (also kept in self.encoded_charts for embedding)."""
         try:
             img_data = base64.b64decode(encoded_str)
             filepath = self.output_dir / filename
@@ -47,6 +72,7 @@ class PortfolioChartGenerator:
                 f.write(img_data)
             print(f"✅ Saved: {filename}")
             self.generated_charts.append(str(filepath))
+            self.encoded_charts[filename] = encoded_str
             return str(filepath)
         except Exception as e:
             print(f"❌ Error saving {filename}: {e}")
@@ -56,10 +82,9 @@ class PortfolioChartGenerator:
         """Generate market sentiment dashboard (Indian indices)."""
         print("\n📊 Generating Market Sentiment Dashboard...")
         try:
-            # Indian market indices
-            indices = ['^NSEI', '^BSESN', '^NSEBANK', '^NSEMDCP50', '^INDIAVIX']
-            
-            sentiment_img = self.viz.generate_market_sentiment_dashboard(indices=indices)
+            sentiment_img = self.viz.generate_market_sentiment_dashboard(
+                indices=MARKET_INDICES, history=self.get_price_history()
+            )
             return self.save_base64_image(sentiment_img, "market_sentiment_dashboard.png")
         except Exception as e:
             print(f"❌ Market Sentiment Dashboard failed: {e}")
@@ -82,7 +107,9 @@ class PortfolioChartGenerator:
         print(f"   - Tracking {len(symbols)} stocks: {', '.join(symbols)}")
         
         try:
-            portfolio_img = self.viz.generate_portfolio_tracking(symbols=symbols)
+            portfolio_img = self.viz.generate_portfolio_tracking(
+                symbols=symbols, history=self.get_price_history()
+            )
             return self.save_base64_image(portfolio_img, "portfolio_performance_tracker.png")
         except Exception as e:
             print(f"❌ Portfolio Tracker failed: {e}")
@@ -98,23 +125,29 @@ class PortfolioChartGenerator:
             print("⚠️ No holdings found for analysis")
             return []
         
-        chart_paths = []
-        
-        for holding in holdings:
+        def render(holding):
             symbol = holding['symbol']
             yahoo_symbol = normalize_symbol(symbol)
             
             print(f"   - Analyzing {symbol} ({yahoo_symbol})...")
             
             try:
-                stock_img = self.viz.generate_stock_analysis(symbol=yahoo_symbol)
-                filename = f"stock_analysis_{symbol}.png"
-                path = self.save_base64_image(stock_img, filename)
-                if path:
-                    chart_paths.append(path)
+                return symbol, self.viz.generate_stock_analysis(symbol=yahoo_symbol, history=history)
             except Exception as e:
                 print(f"     ❌ Failed to analyze {symbol}: {e}")
-                continue
+                return symbol, None
+        
+        history = self.get_price_history()
+        chart_paths = []
+        
+        # Remaining Yahoo Finance calls are network-bound — run them concurrently, save in order
+        with ThreadPoolExecutor(max_workers=min(8, len(holdings))) as executor:
+            for symbol, stock_img in executor.map(render, holdings):
+                if stock_img is None:
+                    continue
+                path = self.save_base64_image(stock_img, f"stock_analysis_{symbol}.png")
+                if path:
+                    chart_paths.append(path)
         
         return chart_paths
     
@@ -132,6 +165,8 @@ class PortfolioChartGenerator:
         print(f"   - Analyzing {len(mutual_funds)} mutual fund schemes")
         
         try:
+            from mf_viz import MutualFundVisualizer
+            
             mf_viz = MutualFundVisualizer()
             mf_img = mf_viz.generate_mf_performance(mutual_funds)
             return self.save_base64_image(mf_img, "mf_performance_overview.png")
@@ -165,17 +200,23 @@ class PortfolioChartGenerator:
         print(f"\n⏰ Started at: {timestamp}")
         print("\n" + "=" * 60)
         
-        # 1. Market Sentiment Dashboard
-        self.generate_market_sentiment()
-        
-        # 2. Portfolio Performance Tracker
-        self.generate_portfolio_tracker()
-        
-        # 3. Individual Stock Analyses (dynamic count)
-        self.generate_stock_analyses()
-        
-        # 4. Mutual Fund Performance Chart
-        self.generate_mf_performance()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            # Cold-start kaleido while the batched price history downloads
+            executor.submit(warm_up_renderer)
+            self.get_price_history()
+            
+            # 1. Market Sentiment Dashboard
+            # 2. Portfolio Performance Tracker
+            # 3. Individual Stock Analyses (dynamic count)
+            # 4. Mutual Fund Performance Chart
+            jobs = [
+                executor.submit(self.generate_market_sentiment),
+                executor.submit(self.generate_portfolio_tracker),
+                executor.submit(self.generate_stock_analyses),
+                executor.submit(self.generate_mf_performance),
+            ]
+            for job in jobs:
+                job.result()
         
         # Summary
         print("\n" + "=" * 60)
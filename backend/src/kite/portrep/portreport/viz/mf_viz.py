@@ -3,13 +3,8 @@ Mutual Fund Visualization Module
 Generates performance charts for mutual fund holdings.
 """
 
-import io
 import base64
-import pandas as pd
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 from datetime import datetime
-from PIL import Image
 
 COLORS = {
     'primary': '#1F77B4',
@@ -37,6 +32,10 @@ class MutualFundVisualizer:
         Returns:
             str: base64 encoded image
         """
+        # Heavy imports deferred until a chart is actually rendered
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+        
         if not mf_data:
             # Return empty chart with message
             fig = go.Figure()
@@ -64,8 +63,8 @@ class MutualFundVisualizer:
             '#17BECF'   # Cyan
         ]
         
-        # Assign colors to each scheme
-        color_map = {mf['scheme_name']: scheme_colors[i % len(scheme_colors)] for i, mf in enumerate(mf_data)}
+        # Assign colors to each scheme by position (consistent across charts)
+        bar_colors = [scheme_colors[i % len(scheme_colors)] for i in range(len(mf_data))]
         
         # Create subplots with more spacing
         fig = make_subplots(
@@ -85,16 +84,22 @@ class MutualFundVisualizer:
             row_heights=[0.45, 0.55]  # More space for table
         )
         
-        # Extract data
-        schemes = [mf['scheme_name'][:30] + "..." if len(mf['scheme_name']) > 30 else mf['scheme_name'] for mf in mf_data]
-        full_schemes = [mf['scheme_name'] for mf in mf_data]
-        gains = [mf['gain_pct'] for mf in mf_data]
-        values = [mf['value'] for mf in mf_data]
-        units = [mf['units'] for mf in mf_data]
-        navs = [mf['nav'] for mf in mf_data]
-        
-        # Get colors for each scheme (consistent across charts)
-        bar_colors = [color_map[mf['scheme_name']] for mf in mf_data]
+        # Extract chart series and table columns in a single pass
+        schemes, gains, values, gain_colors = [], [], [], []
+        table_names, table_units, table_navs, table_values, table_gains = [], [], [], [], []
+        for mf in mf_data:
+            name = mf['scheme_name']
+            gain = mf['gain_pct']
+            schemes.append(name[:30] + "..." if len(name) > 30 else name)
+            gains.append(gain)
+            values.append(mf['value'])
+            gain_colors.append('green' if gain >= 0 else 'red')
+            
+            table_names.append(name[:40] + "..." if len(name) > 40 else name)
+            table_units.append(f"{mf['units']:.2f}")
+            table_navs.append(f"₹{mf['nav']:.2f}")
+            table_values.append(f"₹{mf['value']:,.2f}")
+            table_gains.append(f"{gain:.2f}%")
         
         # 1. Performance Bar Chart with consistent colors
         fig.add_trace(
@@ -142,23 +147,7 @@ class MutualFundVisualizer:
             row=1, col=2
         )
         
-        # 3. Holdings Table (positioned lower)
-        table_data = []
-        for mf in mf_data:
-            scheme_name = mf['scheme_name'][:40] + "..." if len(mf['scheme_name']) > 40 else mf['scheme_name']
-            table_data.append([
-                scheme_name,
-                f"{mf['units']:.2f}",
-                f"₹{mf['nav']:.2f}",
-                f"₹{mf['value']:,.2f}",
-                f"{mf['gain_pct']:.2f}%"
-            ])
-        
-        transposed_data = list(map(list, zip(*table_data)))
-        
-        # Color code gain column
-        gain_colors = ['green' if mf['gain_pct'] >= 0 else 'red' for mf in mf_data]
-        
+        # 3. Holdings Table (positioned lower, gain column color coded)
         fig.add_trace(
             go.Table(
                 header=dict(
@@ -169,7 +158,7 @@ class MutualFundVisualizer:
                     font=dict(color='white', size=12)
                 ),
                 cells=dict(
-                    values=transposed_data,
+                    values=[table_names, table_units, table_navs, table_values, table_gains],
                     line_color='white',
                     fill_color=[[COLORS['background'], '#E6F2FF'] * len(mf_data)],
                     align='left',
@@ -225,7 +214,7 @@ class MutualFundVisualizer:
         )
         
         # Convert to base64
-        img_bytes = fig.to_image(format="png", width=1200, height=1100, scale=2)
+        img_bytes = fig.to_image(format="png", width=1200, height=1100, scale=1)
         encoded = base64.b64encode(img_bytes).decode('ascii')
         
         return encoded
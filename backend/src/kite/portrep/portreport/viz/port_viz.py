@@ -30,10 +30,55 @@ COLORS = {
 }
 
 
+def fetch_history(symbols, start, end):
+    """
+    Download daily OHLCV for many symbols with a single Yahoo Finance request.
+
+    Returns:
+        dict: symbol -> DataFrame; symbols Yahoo returned no rows for are left out
+              so callers fall back to a per-symbol Ticker.history fetch
+    """
+    symbols = list(dict.fromkeys(symbols))
+    if not symbols:
+        return {}
+
+    raw = yf.download(tickers=symbols, start=start, end=end, group_by='ticker',
+                      threads=True, progress=False, auto_adjust=True)
+
+    history = {}
+    for symbol in symbols:
+        if isinstance(raw.columns, pd.MultiIndex):
+            hist = raw[symbol] if symbol in raw.columns.get_level_values(0) else pd.DataFrame()
+        else:
+            hist = raw if len(symbols) == 1 else pd.DataFrame()
+        hist = hist.dropna(how='all')
+        if not hist.empty:
+            history[symbol] = hist
+    return history
+
+
+def warm_up_renderer():
+    """Start kaleido's renderer process ahead of the first real chart export."""
+    try:
+        go.Figure().to_image(format="png", engine="kaleido", width=10, height=10)
+    except Exception as e:
+        print(f"⚠️ Kaleido warm-up failed: {e}")
+
+
+def _since(hist, start):
+    """Slice a history frame from start (handles tz-aware and naive indexes)."""
+    if hist.empty:
+        return hist
+    start = pd.Timestamp(start)
+    if hist.index.tz is not None:
+        start = start.tz_localize(hist.index.tz)
+    return hist[hist.index >= start]
+
+
 class PortfolioVisualizer:
 
     @staticmethod
-    def generate_market_sentiment_dashboard(indices=None):
+    def generate_market_sentiment_dashboard(indices=None, history=None):
         """
         Generate a professional market sentiment dashboard.
         Includes major index performance (with points and percentage change),
@@ -41,6 +86,7 @@ class PortfolioVisualizer:
 
         Args:
             indices (list): List of indices, default is NIFTY 50, SENSEX, BANKNIFTY, NIFTY MIDCAP 50, INDIA VIX.
+            history (dict): Optional prefetched symbol -> DataFrame (see fetch_history)
 
         Returns:
             str: base64 encoded image
@@ -63,9 +109,11 @@ class PortfolioVisualizer:
 
         # Fetch historical data for all indices
         for index in indices:
-            ticker = yf.Ticker(index)
             try:
-                hist = ticker.history(start=start_date, end=end_date)
+                if history is not None and index in history:
+                    hist = _since(history[index], start_date)
+                else:
+                    hist = yf.Ticker(index).history(start=start_date, end=end_date)
                 if not hist.empty:
                     print(f"✅ Retrieved {index} ({len(hist)} trading days)")
                     if index == '^NSEI':
@@ -103,12 +151,13 @@ class PortfolioVisualizer:
 
 
     @staticmethod
-    def generate_portfolio_tracking(symbols=None):
+    def generate_portfolio_tracking(symbols=None, history=None):
         """
         Generate portfolio tracking report for Indian market (NSE)
 
         Args:
             symbols (list): List of NSE stock symbols
+            history (dict): Optional prefetched symbol -> DataFrame (see fetch_history)
 
         Returns:
             str: base64 encoded image
@@ -126,7 +175,10 @@ class PortfolioVisualizer:
 
         for symbol in symbols:
             ticker = yf.Ticker(symbol)
-            hist = ticker.history(start=start_date, end=end_date)
+            if history is not None and symbol in history:
+                hist = _since(history[symbol], start_date)
+            else:
+                hist = ticker.history(start=start_date, end=end_date)
             info = ticker.info
             name = info.get('shortName', symbol)
 
@@ -333,12 +385,13 @@ class PortfolioVisualizer:
         return encoded
 
     @staticmethod
-    def generate_stock_analysis(symbol='WIPRO.NS'):
+    def generate_stock_analysis(symbol='WIPRO.NS', history=None):
         """
         Generate stock technical analysis chart
         
         Args:
             symbol (str): Stock symbol
+            history (dict): Optional prefetched symbol -> DataFrame (see fetch_history)
         
         Returns:
             str: base64 encoded image
@@ -348,7 +401,10 @@ class PortfolioVisualizer:
             ticker = yf.Ticker(symbol)
             end_date = datetime.now()
             start_date = end_date - timedelta(days=180)  # 6 months of data
-            hist = ticker.history(start=start_date, end=end_date)
+            if history is not None and symbol in history:
+                hist = _since(history[symbol], start_date).copy()
+            else:
+                hist = ticker.history(start=start_date, end=end_date)
             
             if hist.empty:
                 # If no data, return a message
@@ -4,9 +4,18 @@ Utility functions for handling stock symbols and formatting.
 Centralized here so both MCP tools and Agent can reuse.
 """
 
+from functools import lru_cache
 from typing import Dict
 
+# Common indices mapped to Yahoo Finance codes
+INDEX_ALIASES: Dict[str, str] = {
+    "SENSEX": "^BSESN",
+    "NIFTY": "^NSEI",
+    "BANKNIFTY": "^NSEBANK",
+}
 
+
+@lru_cache(maxsize=1024)
 def normalize_symbol(symbol: str) -> str:
     """
     Normalize a stock or index symbol for Yahoo Finance.
@@ -15,15 +24,9 @@ def normalize_symbol(symbol: str) -> str:
     - NSE stocks get ".NS" suffix if missing
     - Common indices mapped to Yahoo Finance codes
     """
-    aliases: Dict[str, str] = {
-        "SENSEX": "^BSESN",
-        "NIFTY": "^NSEI",
-        "BANKNIFTY": "^NSEBANK",
-    }
-
     symbol = symbol.strip().replace(" ", "").upper()
-    if symbol in aliases:
-        return aliases[symbol]
+    if symbol in INDEX_ALIASES:
+        return INDEX_ALIASES[symbol]
 
     # Append .NS only for non-index symbols
     return symbol if symbol.endswith(".NS") or symbol.startswith("^") else symbol + ".NS"
@@ -15,6 +15,8 @@ SMTP_USER = os.getenv("SMTP_USER", "")
 SMTP_PASS = os.getenv("SMTP_PASS", "")
 MAIL_FROM = os.getenv("MAIL_FROM", SMTP_USER or "noreply@example.com")
 FALLBACK_EMAIL = os.getenv("FALLBACK_EMAIL", "")
+# Reconnect after this many messages on one SMTP session (Gmail caps ~100 per session)
+SMTP_MAX_SENDS = int(os.getenv("SMTP_MAX_SENDS", "90"))
 
 # Output dir for generated PDFs
 REPORTS_DIR = os.getenv("REPORTS_DIR", "reports")
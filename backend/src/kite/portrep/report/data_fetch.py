@@ -1,5 +1,6 @@
 # data_fetch.py
 import sys
+import asyncio
 from pathlib import Path
 from typing import Any, Dict
 
@@ -13,24 +14,25 @@ from portbot.session_config import SESSION_PATH  # noqa: E402
 
 async def fetch_eod_payload() -> Dict[str, Any]:
     """
-    Use persisted session cookie at src/portbot/session.json.
-    Load cookie BEFORE validating, then reconnect with fresh headers.
+    Validate the client's current session first; only when that fails, load the
+    persisted session cookie at src/portbot/session.json and reconnect with fresh headers.
     If still invalid, invoke LoginAgent.login to refresh cookies, then retry.
     """
     async with MasterAgent(validate_on_enter=False) as master:
         kite = master.kite_client
 
-        # 1) Load cookie FIRST (from shared path)
-        if SESSION_PATH.exists():
+        # 1) Probe the live session — skips cookie I/O and a reconnect when already valid
+        ok = await kite.validate_session()
+
+        # 2) Otherwise load cookie from shared path, reconnect so new headers apply, validate again
+        if not ok and SESSION_PATH.exists():
             print(f"🔁 Loading cookie from {SESSION_PATH}")
             kite.load_session(str(SESSION_PATH))
+            await kite.close()
+            await kite.connect()
+            ok = await kite.validate_session()
 
-        # 2) Reconnect so new headers apply
-        await kite.close()
-        await kite.connect()
-
-        # 3) Validate with loaded cookie
-        ok = await kite.validate_session()
+        # 3) Still invalid — refresh cookies via LoginAgent
         if not ok:
             print("❌ Session invalid — invoking LoginAgent.login to refresh cookies...")
             res = await master.execute("login", "login")
@@ -54,11 +56,14 @@ async def fetch_eod_payload() -> Dict[str, Any]:
 
         print("✅ Session validated. Fetching data from MCP...")
 
-        profile   = await master.execute("account",   "get_profile")
-        margins   = await master.execute("account",   "get_margins")
-        holdings  = await master.execute("portfolio", "get_holdings")
-        positions = await master.execute("portfolio", "get_positions")
-        mfs       = await master.execute("portfolio", "get_mf_holdings")
+        # Independent MCP calls — issue them concurrently
+        profile, margins, holdings, positions, mfs = await asyncio.gather(
+            master.execute("account",   "get_profile"),
+            master.execute("account",   "get_margins"),
+            master.execute("portfolio", "get_holdings"),
+            master.execute("portfolio", "get_positions"),
+            master.execute("portfolio", "get_mf_holdings"),
+        )
 
     return {
         "profile":   profile,
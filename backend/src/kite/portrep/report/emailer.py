@@ -1,10 +1,53 @@
 # emailer.py
 import os
+import atexit
+import threading
 from email.message import EmailMessage
 import email.utils
 import smtplib
 
-from .config import SMTP_HOST, SMTP_PORT, SMTP_USER, SMTP_PASS, MAIL_FROM
+from .config import SMTP_HOST, SMTP_PORT, SMTP_USER, SMTP_PASS, MAIL_FROM, SMTP_MAX_SENDS
+
+# One logged-in SMTP connection reused across reports (SSL + auth handshake is the slow part)
+_smtp_conn = None
+_smtp_sends = 0
+_smtp_lock = threading.RLock()
+
+
+def _get_smtp() -> smtplib.SMTP_SSL:
+    """Return a logged-in SMTP_SSL connection, reusing the previous one while it is alive."""
+    global _smtp_conn, _smtp_sends
+    with _smtp_lock:
+        if _smtp_conn is not None and _smtp_sends >= SMTP_MAX_SENDS:
+            _close_smtp()
+        if _smtp_conn is not None:
+            try:
+                _smtp_conn.noop()
+                return _smtp_conn
+            except (smtplib.SMTPException, OSError):
+                _close_smtp()
+
+        conn = smtplib.SMTP_SSL(host=SMTP_HOST, port=SMTP_PORT)
+        if SMTP_USER and SMTP_PASS:
+            conn.login(SMTP_USER, SMTP_PASS)
+        _smtp_conn = conn
+        _smtp_sends = 0
+        return conn
+
+
+def _close_smtp():
+    """Close the shared SMTP connection (if any)."""
+    global _smtp_conn
+    with _smtp_lock:
+        if _smtp_conn is not None:
+            try:
+                _smtp_conn.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            _smtp_conn = None
+
+
+atexit.register(_close_smtp)
 
 
 def send_email_with_attachment(to_addr: str, subject: str, body: str, attachment_path: str):
@@ -22,8 +65,12 @@ def send_email_with_attachment(to_addr: str, subject: str, body: str, attachment
         data = f.read()
     msg.add_attachment(data, maintype="application", subtype="pdf", filename=os.path.basename(attachment_path))
 
-    # SSL (465) is simplest for Gmail
-    with smtplib.SMTP_SSL(host=SMTP_HOST, port=SMTP_PORT) as s:
-        if SMTP_USER and SMTP_PASS:
-            s.login(SMTP_USER, SMTP_PASS)
-        s.send_message(msg)
+    # SSL (465) is simplest for Gmail; reconnect once if the server dropped us
+    global _smtp_sends
+    with _smtp_lock:
+        try:
+            _get_smtp().send_message(msg)
+        except smtplib.SMTPServerDisconnected:
+            _close_smtp()
+            _get_smtp().send_message(msg)
+        _smtp_sends += 1
@@ -1,70 +1,149 @@
 # pdf_builder.py
+import io
 import os
 import datetime as dt
-from typing import Any, Dict, List
+from itertools import islice
+from typing import Any, Dict, List, Set
+
+import numpy as np
 
 from reportlab.lib.pagesizes import A4
 from reportlab.lib import colors
 from reportlab.lib.units import mm
-from reportlab.platypus import PageBreak
-
-# Proper page break
-from reportlab.platypus import PageBreak
 from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
 
 from .utils import inr, _get, as_list
 
+# Built once per process — styles and table styles are shared (read-only) across PDFs.
+# Any custom fonts (pdfmetrics.registerFont) belong here too, never inside build_eod_pdf.
+_STYLES = getSampleStyleSheet()
+_STYLES["Normal"].fontSize = 10
+_STYLES["Heading1"].fontSize = 16
+_STYLES["Heading2"].fontSize = 12
 
-def build_eod_pdf(payload: Dict[str, Any], out_path: str):
-    """
-    Build a small 2-page EOD PDF:
-      - Page 1: summary KPIs + top holdings
-      - Page 2: day positions + mutual funds
-    """
-    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+# Empty-state PDF bytes by ISO date (the placeholder only changes with the day)
+_EMPTY_PDF_CACHE: Dict[str, bytes] = {}
+
+_NOTES_TEXT = (
+    "This is an auto-generated daily snapshot. Values are approximate. "
+    "Mutual funds and day positions are included on the next page."
+)
+
+# Output directories already ensured by this process
+_DIRS_CREATED: Set[str] = set()
 
-    doc = SimpleDocTemplate(
-        out_path,
+# Above this many holdings the KPI totals are reduced with NumPy instead of a Python loop
+_NUMPY_MIN_ROWS = 64
+
+# Table column widths, scaled to points once per process
+_KPI_COLS = (80*mm, 70*mm)
+_HOLD_COLS = (35*mm, 15*mm, 30*mm, 30*mm, 30*mm)
+_POS_COLS = (50*mm, 20*mm, 25*mm)
+_MF_COLS = (70*mm, 20*mm, 20*mm, 20*mm, 25*mm, 20*mm)
+
+_KPI_STYLE = TableStyle([
+    ("FONT", (0,0), (-1,-1), "Helvetica", 10),
+    ("BACKGROUND", (0,0), (-1,0), colors.whitesmoke),
+    ("BOX", (0,0), (-1,-1), 0.5, colors.grey),
+    ("INNERGRID", (0,0), (-1,-1), 0.25, colors.lightgrey),
+    ("ALIGN", (1,0), (1,-1), "RIGHT"),
+    ("BOTTOMPADDING", (0,0), (-1,-1), 6),
+    ("TOPPADDING", (0,0), (-1,-1), 4),
+])
+
+_HOLDINGS_STYLE = TableStyle([
+    ("BACKGROUND", (0,0), (-1,0), colors.whitesmoke),
+    ("BOX", (0,0), (-1,-1), 0.5, colors.grey),
+    ("INNERGRID", (0,0), (-1,-1), 0.25, colors.lightgrey),
+    ("ALIGN", (1,1), (-1,-1), "RIGHT"),
+    ("FONT", (0,0), (-1,-1), "Helvetica", 9),
+    ("TOPPADDING", (0,0), (-1,-1), 4),
+    ("BOTTOMPADDING", (0,0), (-1,-1), 4),
+])
+
+_POSITIONS_STYLE = TableStyle([
+    ("BACKGROUND", (0,0), (-1,0), colors.whitesmoke),
+    ("BOX", (0,0), (-1,-1), 0.5, colors.grey),
+    ("INNERGRID", (0,0), (-1,-1), 0.25, colors.lightgrey),
+    ("ALIGN", (1,1), (-1,-1), "RIGHT"),
+    ("FONT", (0,0), (-1,-1), "Helvetica", 9),
+])
+
+_MF_STYLE = TableStyle([
+    ("BACKGROUND", (0,0), (-1,0), colors.whitesmoke),
+    ("BOX", (0,0), (-1,-1), 0.5, colors.grey),
+    ("INNERGRID", (0,0), (-1,-1), 0.25, colors.lightgrey),
+    ("ALIGN", (1,1), (-1,-1), "RIGHT"),
+    ("FONT", (0,0), (-1,-1), "Helvetica", 8.5),
+    ("TOPPADDING", (0,0), (-1,-1), 3),
+    ("BOTTOMPADDING", (0,0), (-1,-1), 3),
+])
+
+
+def _new_doc(target) -> SimpleDocTemplate:
+    return SimpleDocTemplate(
+        target,
         pagesize=A4,
         rightMargin=18*mm, leftMargin=18*mm,
         topMargin=16*mm, bottomMargin=16*mm
     )
-    styles = getSampleStyleSheet()
-    styles["Normal"].fontSize = 10
-    styles["Heading1"].fontSize = 16
-    styles["Heading2"].fontSize = 12
 
-    story: List[Any] = []
 
-    # --- Guard: handle empty or invalid payload ---
-    if not payload or not any(payload.values()):
-        story.append(Paragraph("EOD Portfolio Report", styles["Heading1"]))
-        story.append(Spacer(1, 12))
-        story.append(Paragraph(
-            "No portfolio data available. Please complete login once and re-run.",
-            styles["Normal"],
-        ))
-        doc.build(story)
-        print("⚠️ Skipping empty PDF — no data to render.")
-        return
+def _empty_pdf_bytes() -> bytes:
+    """Placeholder PDF for an empty payload, rendered once per day."""
+    key = dt.date.today().isoformat()
+    blob = _EMPTY_PDF_CACHE.get(key)
+    if blob is None:
+        buf = io.BytesIO()
+        _new_doc(buf).build([
+            Paragraph("EOD Portfolio Report", _STYLES["Heading1"]),
+            Spacer(1, 12),
+            Paragraph(
+                "No portfolio data available. Please complete login once and re-run.",
+                _STYLES["Normal"],
+            ),
+        ])
+        blob = buf.getvalue()
+        _EMPTY_PDF_CACHE.clear()  # drop previous days
+        _EMPTY_PDF_CACHE[key] = blob
+    return blob
 
 
-        # Handle empty or invalid payload gracefully
-    if not payload or not any(payload.values()):
-        story.append(Paragraph("EOD Portfolio Report", styles["Heading1"]))
-        story.append(Spacer(1, 12))
-        story.append(Paragraph(
-            "No portfolio data available for this session. "
-            "Please ensure Kite MCP is logged in before generating the report.",
-            styles["Normal"],
-        ))
-        doc.build(story)
-        return
+def _holding_row(h: Dict[str, Any]) -> tuple:
+    get = h.get  # bound once per row
+    return (
+        get("symbol") or get("tradingsymbol") or "",
+        f"{get('qty', 0):.0f}",
+        inr(get("avg", get("average_price", 0))),
+        inr(get("ltp", get("last_price", 0))),
+        inr(get("pnl", 0)),
+    )
 
 
-    # ----- Page 1 -----
-    today = dt.date.today().strftime("%d %b %Y")
+def _position_row(p: Dict[str, Any]) -> tuple:
+    get = p.get
+    return (
+        get("symbol") or get("tradingsymbol") or "",
+        f"{get('qty', 0):.0f}",
+        inr(get("pnl", 0)),
+    )
+
+
+def _mf_row(m: Dict[str, Any]) -> tuple:
+    get = m.get
+    return (
+        (get("scheme") or "")[:38],
+        f"{get('units', 0):.2f}",
+        inr(get("avg_nav", 0)),
+        inr(get("nav", 0)),
+        inr(get("value", 0)),
+        f"{float(get('gain_pct', 0.0)):.2f}%",
+    )
+
+
+def _report_data(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract the header line, KPI rows and the three tables from the payload."""
     profile = payload.get("profile", {})
     margins = payload.get("margins", {})
     holds = payload.get("holdings", {})
@@ -74,133 +153,136 @@ def build_eod_pdf(payload: Dict[str, Any], out_path: str):
     user_name = _get(profile, "data", "user_name", default="User")
     broker = _get(profile, "data", "broker", default="")
 
-    story.append(Paragraph(f"EOD Portfolio Brief — {today}", styles["Heading1"]))
-    story.append(Paragraph(f"{user_name}  •  {broker}", styles["Normal"]))
-    story.append(Spacer(1, 8))
-
     # KPIs
     hold_rows = as_list(holds.get("data"))
-    total_mv = sum(float(h.get("ltp", 0.0)) * float(h.get("qty", 0.0))
-                   for h in hold_rows if isinstance(h, dict))
-    total_pnl = sum(float(h.get("pnl", 0.0)) for h in hold_rows if isinstance(h, dict))
+    rows = [h for h in hold_rows if isinstance(h, dict)]
+    if len(rows) > _NUMPY_MIN_ROWS:
+        n = len(rows)
+        ltp = np.fromiter((float(h.get("ltp", 0.0)) for h in rows), dtype=np.float64, count=n)
+        qty = np.fromiter((float(h.get("qty", 0.0)) for h in rows), dtype=np.float64, count=n)
+        pnl = np.fromiter((float(h.get("pnl", 0.0)) for h in rows), dtype=np.float64, count=n)
+        total_mv = float(ltp @ qty)
+        total_pnl = float(pnl.sum())
+    else:
+        total_mv = 0.0
+        total_pnl = 0.0
+        for h in rows:  # one pass for both totals
+            total_mv += float(h.get("ltp", 0.0)) * float(h.get("qty", 0.0))
+            total_pnl += float(h.get("pnl", 0.0))
 
     eq_cash = (
         _get(margins, "data", "equity", "available", "cash", default=None)
         or _get(margins, "data", "available", "cash", default=0.0)
     )
 
-    kpi_tbl = Table(
-        [
-            ["Total Portfolio Value", inr(total_mv)],
-            ["Total P&L (approx)", inr(total_pnl)],
-            ["Cash Available (Equity)", inr(eq_cash)],
-        ],
-        colWidths=[80*mm, 70*mm]
-    )
-    kpi_tbl.setStyle(TableStyle([
-        ("FONT", (0,0), (-1,-1), "Helvetica", 10),
-        ("BACKGROUND", (0,0), (-1,0), colors.whitesmoke),
-        ("BOX", (0,0), (-1,-1), 0.5, colors.grey),
-        ("INNERGRID", (0,0), (-1,-1), 0.25, colors.lightgrey),
-        ("ALIGN", (1,0), (1,-1), "RIGHT"),
-        ("BOTTOMPADDING", (0,0), (-1,-1), 6),
-        ("TOPPADDING", (0,0), (-1,-1), 4),
-    ]))
+    kpi_rows = [
+        ("Total Portfolio Value", inr(total_mv)),
+        ("Total P&L (approx)", inr(total_pnl)),
+        ("Cash Available (Equity)", inr(eq_cash)),
+    ]
+
+    # Holdings (top)
+    h_rows = [("Symbol", "Qty", "Avg", "LTP", "P&L")]
+    h_rows.extend(_holding_row(h) for h in rows[:8])  # rows is already filtered to dicts
+    if len(h_rows) == 1:
+        h_rows.append(("—",) * 5)
+
+    # Positions
+    pos_rows = as_list(poss.get("data"))
+    p_rows = [("Symbol", "Qty", "P&L")]
+    p_rows.extend(_position_row(p) for p in islice((x for x in pos_rows if isinstance(x, dict)), 10))
+    if len(p_rows) == 1:
+        p_rows.append(("—",) * 3)
+
+    # Mutual Funds
+    mf_rows = as_list(mfs.get("data"))
+    m_rows = [("Scheme", "Units", "AVG", "NAV", "Value", "Gain%")]
+    m_rows.extend(_mf_row(m) for m in islice((x for x in mf_rows if isinstance(x, dict)), 10))
+    if len(m_rows) == 1:
+        m_rows.append(("—",) * 6)
+
+    return {
+        "title": f"EOD Portfolio Brief — {dt.date.today().strftime('%d %b %Y')}",
+        "subtitle": f"{user_name}  •  {broker}",
+        "kpis": kpi_rows,
+        "holdings": h_rows,
+        "positions": p_rows,
+        "mfs": m_rows,
+    }
+
+
+def _build_eod_pdf_reportlab(data: Dict[str, Any]) -> bytes:
+    """Platypus story rendered into an in-memory buffer."""
+    buf = io.BytesIO()
+    doc = _new_doc(buf)
+    styles = _STYLES
+
+    story: List[Any] = []
+
+    # ----- Page 1 -----
+    story.append(Paragraph(data["title"], styles["Heading1"]))
+    story.append(Paragraph(data["subtitle"], styles["Normal"]))
+    story.append(Spacer(1, 8))
+
+    kpi_tbl = Table(data["kpis"], colWidths=_KPI_COLS)
+    kpi_tbl.setStyle(_KPI_STYLE)
     story.append(kpi_tbl)
     story.append(Spacer(1, 12))
 
-    # Holdings (top)
     story.append(Paragraph("Equity Holdings (top)", styles["Heading2"]))
-    h_rows = [["Symbol", "Qty", "Avg", "LTP", "P&L"]]
-    for h in hold_rows[:8]:
-        if not isinstance(h, dict):
-            continue
-        h_rows.append([
-            h.get("symbol") or h.get("tradingsymbol") or "",
-            f"{h.get('qty', 0):.0f}",
-            inr(h.get("avg", h.get("average_price", 0))),
-            inr(h.get("ltp", h.get("last_price", 0))),
-            inr(h.get("pnl", 0)),
-        ])
-    if len(h_rows) == 1:
-        h_rows.append(["—", "—", "—", "—", "—"])
-    tbl = Table(h_rows, colWidths=[35*mm, 15*mm, 30*mm, 30*mm, 30*mm])
-    tbl.setStyle(TableStyle([
-        ("BACKGROUND", (0,0), (-1,0), colors.whitesmoke),
-        ("BOX", (0,0), (-1,-1), 0.5, colors.grey),
-        ("INNERGRID", (0,0), (-1,-1), 0.25, colors.lightgrey),
-        ("ALIGN", (1,1), (-1,-1), "RIGHT"),
-        ("FONT", (0,0), (-1,-1), "Helvetica", 9),
-        ("TOPPADDING", (0,0), (-1,-1), 4),
-        ("BOTTOMPADDING", (0,0), (-1,-1), 4),
-    ]))
+    tbl = Table(data["holdings"], colWidths=_HOLD_COLS)
+    tbl.setStyle(_HOLDINGS_STYLE)
     story.append(tbl)
 
     story.append(Spacer(1, 14))
     story.append(Paragraph("Notes", styles["Heading2"]))
-    story.append(Paragraph(
-        "This is an auto-generated daily snapshot. Values are approximate. "
-        "Mutual funds and day positions are included on the next page.",
-        styles["Normal"],
-    ))
+    story.append(Paragraph(_NOTES_TEXT, styles["Normal"]))
 
     # Page break (simple spacer)
     story.append(PageBreak())
 
     # ----- Page 2 -----
-    # Positions
     story.append(Paragraph("Day Positions", styles["Heading2"]))
-    pos_rows = as_list(poss.get("data"))
-    p_rows = [["Symbol", "Qty", "P&L"]]
-    for p in pos_rows[:10]:
-        if not isinstance(p, dict):
-            continue
-        p_rows.append([
-            p.get("symbol") or p.get("tradingsymbol") or "",
-            f"{p.get('qty', 0):.0f}",
-            inr(p.get("pnl", 0)),
-        ])
-    if len(p_rows) == 1:
-        p_rows.append(["—", "—", "—"])
-    ptbl = Table(p_rows, colWidths=[50*mm, 20*mm, 25*mm])
-    ptbl.setStyle(TableStyle([
-        ("BACKGROUND", (0,0), (-1,0), colors.whitesmoke),
-        ("BOX", (0,0), (-1,-1), 0.5, colors.grey),
-        ("INNERGRID", (0,0), (-1,-1), 0.25, colors.lightgrey),
-        ("ALIGN", (1,1), (-1,-1), "RIGHT"),
-        ("FONT", (0,0), (-1,-1), "Helvetica", 9),
-    ]))
+    ptbl = Table(data["positions"], colWidths=_POS_COLS)
+    ptbl.setStyle(_POSITIONS_STYLE)
     story.append(ptbl)
 
     story.append(Spacer(1, 12))
 
-    # Mutual Funds
     story.append(Paragraph("Mutual Funds", styles["Heading2"]))
-    mf_rows = as_list(mfs.get("data"))
-    m_rows = [["Scheme", "Units", "AVG", "NAV", "Value", "Gain%"]]
-    for m in mf_rows[:10]:
-        if not isinstance(m, dict):
-            continue
-        m_rows.append([
-            (m.get("scheme") or "")[:38],
-            f"{m.get('units', 0):.2f}",
-            inr(m.get("avg_nav", 0)),
-            inr(m.get("nav", 0)),
-            inr(m.get("value", 0)),
-            f"{float(m.get('gain_pct', 0.0)):.2f}%",
-        ])
-    if len(m_rows) == 1:
-        m_rows.append(["—", "—", "—", "—", "—", "—"])
-    mtbl = Table(m_rows, colWidths=[70*mm, 20*mm, 20*mm, 20*mm, 25*mm, 20*mm])
-    mtbl.setStyle(TableStyle([
-        ("BACKGROUND", (0,0), (-1,0), colors.whitesmoke),
-        ("BOX", (0,0), (-1,-1), 0.5, colors.grey),
-        ("INNERGRID", (0,0), (-1,-1), 0.25, colors.lightgrey),
-        ("ALIGN", (1,1), (-1,-1), "RIGHT"),
-        ("FONT", (0,0), (-1,-1), "Helvetica", 8.5),
-        ("TOPPADDING", (0,0), (-1,-1), 3),
-        ("BOTTOMPADDING", (0,0), (-1,-1), 3),
-    ]))
+    mtbl = Table(data["mfs"], colWidths=_MF_COLS)
+    mtbl.setStyle(_MF_STYLE)
     story.append(mtbl)
 
     doc.build(story)
+    return buf.getvalue()
+
+
+def build_eod_pdf(payload: Dict[str, Any], out_path: str):
+    """
+    Build a small 2-page EOD PDF:
+      - Page 1: summary KPIs + top holdings
+      - Page 2: day positions + mutual funds
+    """
+    out_dir = os.path.dirname(out_path)
+    if out_dir not in _DIRS_CREATED:  # one makedirs per directory per process
+        if out_dir:
+            os.makedirs(out_dir, exist_ok=True)
+        _DIRS_CREATED.add(out_dir)
+
+    # --- Guard: handle empty or invalid payload ---
+    # Probe the five sections fetch_eod_payload returns; short-circuits on the first non-empty one
+    get = payload.get if payload else None
+    if not get or not (
+        get("holdings") or get("positions") or get("mfs") or get("margins") or get("profile")
+    ):
+        with open(out_path, "wb") as f:
+            f.write(_empty_pdf_bytes())
+        print("⚠️ Skipping empty PDF — no data to render.")
+        return
+
+    blob = _build_eod_pdf_reportlab(_report_data(payload))
+
+    # Render in memory, then hit the disk with one sequential write
+    with open(out_path, "wb") as f:
+        f.write(blob)
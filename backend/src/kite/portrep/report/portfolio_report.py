@@ -2,6 +2,7 @@
 import os
 import asyncio
 import datetime as dt
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from src.report.config import (
@@ -15,6 +16,71 @@ from src.report.pdf_builder import build_eod_pdf
 from src.report.emailer import send_email_with_attachment
 
 
+# Max recipients in flight at once (build + send)
+EOD_CONCURRENCY = 8
+
+
+def _build(job):
+    """Build one recipient's EOD PDF. job: {"payload", "to", "out_path"}."""
+    build_eod_pdf(job["payload"], job["out_path"])
+
+
+def _send(job):
+    """Email one recipient's built EOD PDF."""
+    send_email_with_attachment(
+        to_addr=job["to"],
+        subject=f"EOD Portfolio Brief — {dt.date.today():%d %b %Y}",
+        body="Attached is your daily portfolio brief.\n\n(Reply STOP to opt out.)",
+        attachment_path=job["out_path"],
+    )
+    print(f"✅ Sent EOD report to {job['to']}: {job['out_path']}")
+
+
+async def _process_one(job, sem, pool):
+    """Build (in pool; default thread executor when None) then send (in a thread), bounded by sem."""
+    async with sem:
+        await asyncio.get_running_loop().run_in_executor(pool, _build, job)
+        await asyncio.to_thread(_send, job)
+
+
+async def render_and_send_all(jobs, max_workers=None, concurrency=EOD_CONCURRENCY):
+    """
+    Render and send many recipients' reports concurrently.
+
+    PDF builds are CPU-bound and fan out across processes; SMTP sends run in
+    threads so one recipient's send overlaps the next one's build. A single job
+    skips the process pool. Failures don't stop the other recipients, but are
+    re-raised once all are done (the original exception for one failure, a
+    RuntimeError naming each recipient for several) so the run still exits non-zero.
+    """
+    jobs = list(jobs)
+    sem = asyncio.Semaphore(concurrency)
+
+    async def run(pool):
+        # Let every recipient finish, then fail the run if any of them failed
+        results = await asyncio.gather(*(_process_one(job, sem, pool) for job in jobs), return_exceptions=True)
+        failed = []
+        for job, res in zip(jobs, results):
+            if isinstance(res, Exception):
+                print(f"❌ EOD report failed for {job['to']}: {res}")
+                failed.append((job, res))
+        if len(failed) == 1:
+            raise failed[0][1]
+        if failed:
+            raise RuntimeError(
+                f"EOD report failed for {len(failed)} recipients: "
+                + ", ".join(f"{job['to']} ({res!r})" for job, res in failed)
+            ) from failed[0][1]
+
+    if len(jobs) < 2:
+        await run(None)
+        return
+    # No more workers than PDFs: each spawned interpreter re-imports reportlab
+    workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        await run(pool)
+
+
 async def main():
     if not EOD_REPORTS_ENABLED:
         print("EOD reports disabled by env. Set EOD_REPORTS_ENABLED=1 to enable.")
@@ -33,17 +99,8 @@ async def main():
     out_dir = Path(REPORTS_DIR)
     out_path = out_dir / f"{today}_EOD.pdf"
 
-    # build pdf
-    build_eod_pdf(payload, str(out_path))
-
-    # send
-    send_email_with_attachment(
-        to_addr=to,
-        subject=f"EOD Portfolio Brief — {dt.date.today():%d %b %Y}",
-        body="Attached is your daily portfolio brief.\n\n(Reply STOP to opt out.)",
-        attachment_path=str(out_path),
-    )
-    print(f"✅ Sent EOD report to {to}: {out_path}")
+    # build pdf + send
+    await render_and_send_all([{"payload": payload, "to": to, "out_path": str(out_path)}])
 
 
 if __name__ == "__main__":
@@ -8,21 +8,25 @@ def inr(x: Any) -> str:
         return "₹-"
 
 def _get(d: Dict, *keys, default=None):
+    # EAFP: plain subscripts on the happy path; any missing key / non-dict level -> default
     cur = d
-    for k in keys:
-        if not isinstance(cur, dict):
-            return default
-        cur = cur.get(k, None)
+    try:
+        for k in keys:
+            cur = cur[k]
+    except (KeyError, TypeError, IndexError, AttributeError):
+        return default
     return cur if cur is not None else default
 
+_LIST_KEYS = ("data", "items", "rows", "holdings", "positions")
+
 def as_list(obj: Any) -> List[Any]:
-    if isinstance(obj, list):
+    # Exact-type dispatch; payloads come straight from JSON so subclasses don't occur
+    t = type(obj)
+    if t is list:
         return obj
-    if isinstance(obj, dict):
-        for k in ("data", "items", "rows", "holdings", "positions"):
-            if k in obj and isinstance(obj[k], list):
-                return obj[k]
-    if isinstance(obj, str):
-        s = obj.strip()
-        return [] if s in ("", "[]") else []
+    if t is dict:
+        for k in _LIST_KEYS:  # "data" first — by far the common envelope
+            v = obj.get(k)
+            if type(v) is list:
+                return v
     return []
@@ -1,9 +1,15 @@
+import os
+import time
+import pickle
+import hashlib
 import numpy as np
 import pandas as pd
 from datetime import datetime
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import yfinance as yf
+from pathlib import Path
+from functools import lru_cache
+
+# plotly / yfinance are imported inside the functions that use them, so importing
+# this module (e.g. at app start-up) doesn't pay their import cost
 # from fear_greed_india import FearAndGreedIndia
 # from ..vizualization import COLORS  # Assuming COLORS is defined as before
 
@@ -20,6 +26,137 @@ COLORS = {
     'text': '#333333'       # Dark gray
 }
 
+# Shared style fragments (constant across calls; Plotly copies them on assignment)
+TITLE_FONT = {"size": 24, "color": COLORS['text'], "family": "Arial, sans-serif"}
+BASE_FONT = {"family": "Arial, sans-serif", "size": 12, "color": COLORS['text']}
+COMMON_MARGIN = {"l": 40, "r": 40, "t": 120, "b": 40}
+DASHBOARD_MARGIN = {"l": 50, "r": 50, "t": 100, "b": 50}
+TOP_LEGEND = {"orientation": "h", "yanchor": "bottom", "y": 1.01, "xanchor": "right", "x": 1}
+AXIS_GRID_STYLE = {
+    "gridcolor": 'rgba(211, 211, 211, 0.5)',
+    "showline": True,
+    "linecolor": 'lightgray',
+    "linewidth": 1,
+    "showgrid": True,
+    "gridwidth": 1,
+}
+NIFTY_LINE = {"color": "#1f77b4", "width": 2}  # Blue
+VIX_LINE = {"color": "#d62728", "width": 2}    # Red
+REFERENCE_LINE = {"color": "black", "width": 1, "dash": "dash"}
+LABEL_FONT = {"size": 12}
+NOTE_FONT = {"size": 10}
+EXTREME_FEAR_FONT = {"size": 10, "color": "#d73027"}
+EXTREME_GREED_FONT = {"size": 10, "color": "#1a9850"}
+
+
+# Disk cache for batched Yahoo Finance downloads (seconds; 0 disables)
+CACHE_DIR = Path(__file__).parent / ".cache"
+CACHE_TTL = int(os.getenv("MARKET_DATA_CACHE_TTL", "3600"))
+
+# create_dashboard keyword -> Yahoo Finance ticker (same mapping as PortfolioVisualizer)
+DASHBOARD_TICKERS = {
+    "data_nifty": "^NSEI",
+    "data_nifty_next50": "^NSEBANK",
+    "data_sensex": "^BSESN",
+    "data_smallcap": "^NSEMDCP50",
+    "data_vix": "^INDIAVIX",
+}
+
+# India VIX levels mapped to the ends of the fear & greed scale
+VIX_EXTREME_GREED = 10.0
+VIX_EXTREME_FEAR = 40.0
+
+# Score band lower bounds; np.searchsorted(..., side="right") gives the SENTIMENTS index
+SENTIMENT_THRESHOLDS = np.array([25.0, 45.0, 55.0, 75.0])
+
+# (label, text color, gauge bar color) by sentiment bucket, Extreme Fear -> Extreme Greed
+SENTIMENTS = (
+    ("Extreme Fear", "#d73027", "#fc8d59"),
+    ("Fear", "#fdae61", "#fee08b"),
+    ("Neutral", "#d8c343", "#ffffbf"),
+    ("Greed", "#66bd63", "#a6d96a"),
+    ("Extreme Greed", "#1a9850", "#66bd63"),
+)
+
+# Static gauge bands (shared by every dashboard)
+GAUGE_STEPS = [
+    {"range": [0, 25], "color": "#d73027"},
+    {"range": [25, 45], "color": "#fdae61"},
+    {"range": [45, 55], "color": "#ffffbf"},
+    {"range": [55, 75], "color": "#a6d96a"},
+    {"range": [75, 100], "color": "#1a9850"}
+]
+
+
+@lru_cache(maxsize=1)
+def _plotly_extras():
+    """
+    Configure optional Plotly add-ons on first use.
+
+    - orjson: serialize figures with orjson (native NumPy support) instead of stdlib json
+    """
+    import plotly.io as pio
+    try:
+        import orjson  # noqa: F401
+        pio.json.config.default_engine = "orjson"
+    except ImportError:
+        pass
+
+
+def fear_greed_score(vix_value):
+    """Map India VIX to a 0-100 fear & greed score and its SENTIMENTS index."""
+    clamped = min(max(vix_value, VIX_EXTREME_GREED), VIX_EXTREME_FEAR)
+    score = 100.0 - (clamped - VIX_EXTREME_GREED) / (VIX_EXTREME_FEAR - VIX_EXTREME_GREED) * 100.0
+    return score, int(np.searchsorted(SENTIMENT_THRESHOLDS, score, side="right"))
+
+
+def fetch_history(tickers, start, end, interval="1d"):
+    """
+    Download OHLCV for all tickers with a single threaded yf.download call.
+
+    Results are pickled under CACHE_DIR keyed by (tickers, start, end, interval)
+    and reused for CACHE_TTL seconds.
+
+    Returns:
+        dict: ticker -> DataFrame (empty when Yahoo returned no rows)
+    """
+    tickers = list(dict.fromkeys(tickers))
+    if not tickers:
+        return {}
+
+    key = hashlib.blake2b(
+        repr((tickers, str(pd.Timestamp(start).date()), str(pd.Timestamp(end).date()), interval)).encode("utf-8"),
+        digest_size=16,
+    ).hexdigest()
+    path = CACHE_DIR / f"{key}.pkl"
+    if CACHE_TTL > 0 and path.exists() and time.time() - path.stat().st_mtime < CACHE_TTL:
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            pass
+
+    import yfinance as yf
+
+    raw = yf.download(tickers=tickers, start=start, end=end, interval=interval, group_by="ticker",
+                      threads=True, progress=False, auto_adjust=True)
+
+    history = {}
+    for ticker in tickers:
+        if isinstance(raw.columns, pd.MultiIndex):
+            hist = raw[ticker] if ticker in raw.columns.get_level_values(0) else pd.DataFrame()
+        else:
+            hist = raw if len(tickers) == 1 else pd.DataFrame()
+        history[ticker] = hist.dropna(how="all")
+
+    if CACHE_TTL > 0:
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(path, "wb") as f:
+                pickle.dump(history, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            pass
+    return history
 
 
 class NseVixVisualizer:
@@ -30,43 +167,25 @@ class NseVixVisualizer:
         """Apply common styling to plotly figures"""
         fig.update_layout(
             title_text=title,
-            title_font=dict(size=24, color=COLORS['text'], family="Arial, sans-serif"),
-            font=dict(family="Arial, sans-serif", size=12, color=COLORS['text']),
+            title_font=TITLE_FONT,
+            font=BASE_FONT,
             paper_bgcolor=COLORS['background'],
             plot_bgcolor=COLORS['background'],
             height=height,
-            margin=dict(l=40, r=40, t=120, b=40),
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=1.01,
-                xanchor="right",
-                x=1
-            )
+            margin=COMMON_MARGIN,
+            legend=TOP_LEGEND
         )
         # Apply grid styling globally
-        fig.update_xaxes(
-            gridcolor='rgba(211, 211, 211, 0.5)',
-            showline=True,
-            linecolor='lightgray',
-            linewidth=1,
-            showgrid=True,
-            gridwidth=1,
-        )
-        fig.update_yaxes(
-            gridcolor='rgba(211, 211, 211, 0.5)',
-            showline=True,
-            linecolor='lightgray',
-            linewidth=1,
-            showgrid=True,
-            gridwidth=1,
-        )
+        fig.update_xaxes(**AXIS_GRID_STYLE)
+        fig.update_yaxes(**AXIS_GRID_STYLE)
         return fig
 
 
     @staticmethod
     def _add_sp500_vix_chart(fig, data_sp500=None, data_vix=None, row=1, col=1):
         """Add Nifty 50 vs India VIX chart to figure (Indian market adaptation)."""
+        import plotly.graph_objects as go
+
         if data_sp500 is None or data_sp500.empty or data_vix is None or data_vix.empty:
             fig.add_annotation(
                 text="No Nifty 50 or India VIX data available",
@@ -81,27 +200,32 @@ class NseVixVisualizer:
         min_date = max(data_sp500.index.min(), data_vix.index.min())
         max_date = min(data_sp500.index.max(), data_vix.index.max())
 
-        sp500_aligned = data_sp500.loc[(data_sp500.index >= min_date) & (data_sp500.index <= max_date)]
-        vix_aligned = data_vix.loc[(data_vix.index >= min_date) & (data_vix.index <= max_date)]
+        # Date-sorted indexes: binary-search the window instead of building boolean masks
+        sp500_aligned = data_sp500.iloc[data_sp500.index.searchsorted(min_date, side="left"):
+                                        data_sp500.index.searchsorted(max_date, side="right")]
+        vix_aligned = data_vix.iloc[data_vix.index.searchsorted(min_date, side="left"):
+                                    data_vix.index.searchsorted(max_date, side="right")]
+        sp500_close = sp500_aligned["Close"].to_numpy()
+        vix_close = vix_aligned["Close"].to_numpy()
 
         # Calculate percentage changes
-        sp500_pct_change = ((sp500_aligned["Close"].iloc[-1] - sp500_aligned["Close"].iloc[0]) /
-                            sp500_aligned["Close"].iloc[0] * 100) if len(sp500_aligned) > 0 else 0
+        sp500_pct_change = ((sp500_close[-1] - sp500_close[0]) /
+                            sp500_close[0] * 100) if len(sp500_close) > 0 else 0
 
-        vix_pct_change = ((vix_aligned["Close"].iloc[-1] - vix_aligned["Close"].iloc[0]) /
-                          vix_aligned["Close"].iloc[0] * 100) if len(vix_aligned) > 0 else 0
+        vix_pct_change = ((vix_close[-1] - vix_close[0]) /
+                          vix_close[0] * 100) if len(vix_close) > 0 else 0
 
         # Define line colors
-        sp500_color = "#1f77b4"  # Blue
-        vix_color = "#d62728"    # Red
+        sp500_color = NIFTY_LINE["color"]
+        vix_color = VIX_LINE["color"]
 
         # Add Nifty 50 trace
         fig.add_trace(
             go.Scatter(
                 x=sp500_aligned.index,
-                y=sp500_aligned["Close"],
+                y=sp500_close,
                 name="Nifty 50",
-                line=dict(color=sp500_color, width=2),
+                line=NIFTY_LINE,
                 showlegend=False
             ),
             row=row, col=col,
@@ -112,10 +236,10 @@ class NseVixVisualizer:
         fig.add_annotation(
             x=0.02, y=0.97,
             xref="x domain", yref="y domain",
-            text=f"Nifty 50: {sp500_aligned['Close'].iloc[-1]:.2f} INR ({sp500_pct_change:+.2f}%) "
+            text=f"Nifty 50: {sp500_close[-1]:.2f} INR ({sp500_pct_change:+.2f}%) "
                  f"({min_date.strftime('%b %d')} to {max_date.strftime('%b %d')})",
             showarrow=False,
-            font=dict(size=12, color=sp500_color),
+            font=dict(LABEL_FONT, color=sp500_color),
             align="left",
             bgcolor="rgba(255, 255, 255, 0.8)",
             bordercolor="rgba(0, 0, 0, 0.1)",
@@ -128,9 +252,9 @@ class NseVixVisualizer:
         fig.add_trace(
             go.Scatter(
                 x=vix_aligned.index,
-                y=vix_aligned["Close"],
+                y=vix_close,
                 name="India VIX",
-                line=dict(color=vix_color, width=2),
+                line=VIX_LINE,
                 showlegend=False
             ),
             row=row, col=col,
@@ -141,9 +265,9 @@ class NseVixVisualizer:
         fig.add_annotation(
             x=0.98, y=0.97,
             xref="x domain", yref="y domain",
-            text=f"India VIX: {vix_aligned['Close'].iloc[-1]:.2f} ({vix_pct_change:+.2f}%)",
+            text=f"India VIX: {vix_close[-1]:.2f} ({vix_pct_change:+.2f}%)",
             showarrow=False,
-            font=dict(size=12, color=vix_color),
+            font=dict(LABEL_FONT, color=vix_color),
             align="right",
             bgcolor="rgba(255, 255, 255, 0.8)",
             bordercolor="rgba(0, 0, 0, 0.1)",
@@ -152,15 +276,16 @@ class NseVixVisualizer:
             row=row, col=col
         )
 
-        # Update axes
-        fig.update_xaxes(title_text="", gridcolor="lightgray", row=row, col=col)
-        fig.update_yaxes(title_text="Nifty 50 Value (INR)", gridcolor="lightgray", secondary_y=False, row=row, col=col)
-        fig.update_yaxes(title_text="India VIX Value", gridcolor="lightgray", secondary_y=True, row=row, col=col)
+        # Axis titles only — grid styling is applied once by create_dashboard
+        fig.update_yaxes(title_text="Nifty 50 Value (INR)", secondary_y=False, row=row, col=col)
+        fig.update_yaxes(title_text="India VIX Value", secondary_y=True, row=row, col=col)
 
     
     @staticmethod
     def _add_indices_performance_chart(fig, indices_data, row=1, col=1):
         """Add indices performance chart to figure using consistent colors (Indian market adaptation)."""
+        import plotly.graph_objects as go
+
         if not indices_data:
             fig.add_annotation(
                 text="No index data available",
@@ -173,17 +298,14 @@ class NseVixVisualizer:
 
         # Calculate percentage changes
         changes = {}
-        start_dates = {}
-        end_dates = {}
 
         for index_name, df in indices_data.items():
             if len(df) >= 2:
-                latest = df["Close"].iloc[-1]
-                first = df["Close"].iloc[0]
+                closes = df["Close"].to_numpy()
+                latest = closes[-1]
+                first = closes[0]
                 pct_change = ((latest - first) / first) * 100
                 changes[index_name] = pct_change
-                start_dates[index_name] = df.index[0]
-                end_dates[index_name] = df.index[-1]
 
         if not changes:
             fig.add_annotation(
@@ -195,20 +317,6 @@ class NseVixVisualizer:
             )
             return
 
-        # Find common time period (context)
-        common_start = None
-        common_end = None
-        for name in changes.keys():
-            if common_start is None:
-                common_start = start_dates[name]
-            else:
-                common_start = max(common_start, start_dates[name])
-
-            if common_end is None:
-                common_end = end_dates[name]
-            else:
-                common_end = min(common_end, end_dates[name])
-
         # Define consistent colors for Indian indices
         consistent_colors = {
             "Nifty 50": "#1f77b4",    # Blue
@@ -242,9 +350,8 @@ class NseVixVisualizer:
             row=row, col=col
         )
 
-        # Update axes
-        fig.update_xaxes(title_text="", gridcolor="lightgray", row=row, col=col)
-        fig.update_yaxes(title_text="Percentage Change (%)", gridcolor="lightgray", row=row, col=col)
+        # Axis title (grid styling is applied once by create_dashboard)
+        fig.update_yaxes(title_text="Percentage Change (%)", row=row, col=col)
 
         # Reference line at y=0
         fig.add_shape(
@@ -253,13 +360,15 @@ class NseVixVisualizer:
             x1=len(indices) - 0.5,
             y0=0,
             y1=0,
-            line=dict(color="black", width=1, dash="dash"),
+            line=REFERENCE_LINE,
             row=row, col=col
         )
 
     @staticmethod
     def _add_fear_and_greed_gauge(fig, vix_value=None, row=1, col=1):
         """Add fear and greed gauge to figure (Indian market adaptation)."""
+        import plotly.graph_objects as go
+
         if vix_value is None:
             fig.add_annotation(
                 text="No India VIX data available",
@@ -270,37 +379,8 @@ class NseVixVisualizer:
             )
             return
 
-        vix_extreme_greed = 10
-        vix_extreme_fear = 40
-        vix_clamped = max(vix_extreme_greed, min(vix_value, vix_extreme_fear))
-
-        if vix_value <= vix_extreme_greed:
-            fear_greed_value = 100
-        elif vix_value >= vix_extreme_fear:
-            fear_greed_value = 0
-        else:
-            fear_greed_value = 100 - ((vix_clamped - vix_extreme_greed) / (vix_extreme_fear - vix_extreme_greed) * 100)
-
-        if fear_greed_value >= 75:
-            sentiment = "Extreme Greed"
-            color = "#1a9850"
-            bar_color = "#66bd63"
-        elif fear_greed_value >= 55:
-            sentiment = "Greed"
-            color = "#66bd63"
-            bar_color = "#a6d96a"
-        elif fear_greed_value >= 45:
-            sentiment = "Neutral"
-            color = "#d8c343"
-            bar_color = "#ffffbf"
-        elif fear_greed_value >= 25:
-            sentiment = "Fear"
-            color = "#fdae61"
-            bar_color = "#fee08b"
-        else:
-            sentiment = "Extreme Fear"
-            color = "#d73027"
-            bar_color = "#fc8d59"
+        fear_greed_value, sentiment_idx = fear_greed_score(vix_value)
+        sentiment, color, bar_color = SENTIMENTS[sentiment_idx]
 
         score_font_size = 30
         sentiment_font_size = score_font_size
@@ -313,13 +393,7 @@ class NseVixVisualizer:
                 gauge={
                     "axis": {"range": [0, 100], "tickmode": "array", "tickvals": [0, 25, 50, 75, 100], "ticktext": ["", "", "", "", ""], "tickfont": {"size": 10}},
                     "bar": {"color": bar_color, "thickness": 0.3},
-                    "steps": [
-                        {"range": [0, 25], "color": "#d73027"},
-                        {"range": [25, 45], "color": "#fdae61"},
-                        {"range": [45, 55], "color": "#ffffbf"},
-                        {"range": [55, 75], "color": "#a6d96a"},
-                        {"range": [75, 100], "color": "#1a9850"}
-                    ],
+                    "steps": GAUGE_STEPS,
                     "threshold": {"line": {"color": "black", "width": 4}, "thickness": 0.9, "value": fear_greed_value},
                     "bgcolor": "rgba(255, 255, 255, 0.7)",
                     "borderwidth": 1,
@@ -364,7 +438,7 @@ class NseVixVisualizer:
             x=anno_x, y=anno_y_vix,
             text=f"(India VIX: {vix_value:.2f})",
             showarrow=False,
-            font=dict(size=12),
+            font=LABEL_FONT,
             align="center",
             xanchor="center", yanchor="top"
         )
@@ -375,7 +449,7 @@ class NseVixVisualizer:
             x=anno_x_fear_label, y=anno_y_extreme_label,
             text="Extreme Fear",
             showarrow=False,
-            font=dict(size=10, color="#d73027"),
+            font=EXTREME_FEAR_FONT,
             align="left", 
             xanchor="left", yanchor="bottom"
         )
@@ -385,7 +459,7 @@ class NseVixVisualizer:
             x=anno_x_greed_label, y=anno_y_extreme_label,
             text="Extreme Greed",
             showarrow=False,
-            font=dict(size=10, color="#1a9850"),
+            font=EXTREME_GREED_FONT,
             align="right", 
             xanchor="right", yanchor="bottom"
         )
@@ -401,6 +475,8 @@ class NseVixVisualizer:
             row (int, optional): Row to add chart to. Defaults to 1.
             col (int, optional): Column to add chart to. Defaults to 1.
         """
+        import plotly.graph_objects as go
+
         if not indices_data or len(indices_data) < 2:
             fig.add_annotation(
                 text="Insufficient index data for comparison",
@@ -412,16 +488,13 @@ class NseVixVisualizer:
             return
 
         # Calculate relative performance for all indices (normalized to 100)
-        reference_date = None
-        normed_data = {}
+        frames = [df for df in indices_data.values() if df is not None and not df.empty]
 
-        # Find common start date for all indices
-        for name, df in indices_data.items():
-            if df is not None and not df.empty:
-                if reference_date is None:
-                    reference_date = df.index[0]
-                else:
-                    reference_date = max(reference_date, df.index[0])
+        # Find common start date for all indices (max of first timestamps as int64 ns)
+        reference_date = None
+        if frames:
+            starts = np.fromiter((df.index.asi8[0] for df in frames), dtype=np.int64, count=len(frames))
+            reference_date = pd.Timestamp(starts.max(), tz=frames[0].index.tz)
 
         if reference_date is None:
             fig.add_annotation(
@@ -433,14 +506,15 @@ class NseVixVisualizer:
             )
             return
 
-        # Calculate normalized performance for each index
-        for name, df in indices_data.items():
-            if df is not None and not df.empty:
-                filtered_df = df[df.index >= reference_date]
-                if not filtered_df.empty:
-                    reference_value = filtered_df['Close'].iloc[0]
-                    normed_series = (filtered_df['Close'] / reference_value) * 100
-                    normed_data[name] = normed_series
+        # Align all closes into one (dates x indices) array and normalize in a single pass;
+        # each index is rebased on its own first close on/after reference_date
+        combined = pd.concat(
+            {name: df['Close'] for name, df in indices_data.items() if df is not None and not df.empty},
+            axis=1,
+        ).loc[reference_date:]
+        dates = combined.index
+        mat = combined.to_numpy(dtype=float)
+        normed = mat / combined.bfill().to_numpy(dtype=float)[:1, :] * 100.0 if len(mat) else mat
 
         # Define consistent colors for Indian indices
         consistent_colors = {
@@ -451,20 +525,17 @@ class NseVixVisualizer:
         }
 
         # Determine the last date for plotting
-        last_date = None
-        if normed_data:
-            valid_series = [s for s in normed_data.values() if not s.empty]
-            if valid_series:
-                last_date = max(series.index[-1] for series in valid_series)
+        last_date = dates[-1] if len(dates) else None
 
         # Plot each normalized index
-        for name, series in normed_data.items():
-            if not series.empty:
+        for j, name in enumerate(combined.columns):
+            valid = ~np.isnan(normed[:, j])
+            if valid.any():
                 color = consistent_colors.get(name, "#7f7f7f")  # Default gray if name not in colors dict
                 fig.add_trace(
                     go.Scatter(
-                        x=series.index,
-                        y=series,
+                        x=dates[valid],
+                        y=normed[valid, j],
                         name=name,
                         line=dict(color=color, width=2),
                         hovertemplate=f"{name}: %{{y:.2f}}<extra></extra>",
@@ -482,28 +553,33 @@ class NseVixVisualizer:
                 x1=last_date,
                 y0=100,
                 y1=100,
-                line=dict(color="black", width=1, dash="dash"),
+                line=REFERENCE_LINE,
                 row=row, col=col
             )
 
-        # Update axes
-        fig.update_xaxes(
-            title_text="",
-            gridcolor="lightgray",
-            row=row, col=col
-        )
-        fig.update_yaxes(
-            title_text="Relative Performance (%)",
-            gridcolor="lightgray",
-            row=row, col=col
-        )
+        # Axis title (grid styling is applied once by create_dashboard)
+        fig.update_yaxes(title_text="Relative Performance (%)", row=row, col=col)
 
 
     @staticmethod
     def create_dashboard(data_nifty=None, data_nifty_next50=None,
                          data_sensex=None, data_smallcap=None,
-                         data_vix=None, interval="YTD"):
-        """Create a dashboard with Indian market data."""
+                         data_vix=None, interval="YTD", history=None):
+        """Create a dashboard with Indian market data.
+
+        history is an optional ticker -> DataFrame dict (see fetch_history); it fills
+        any data_* argument left as None using DASHBOARD_TICKERS.
+        """
+        if history:
+            data_nifty = data_nifty if data_nifty is not None else history.get(DASHBOARD_TICKERS["data_nifty"])
+            data_nifty_next50 = data_nifty_next50 if data_nifty_next50 is not None else history.get(DASHBOARD_TICKERS["data_nifty_next50"])
+            data_sensex = data_sensex if data_sensex is not None else history.get(DASHBOARD_TICKERS["data_sensex"])
+            data_smallcap = data_smallcap if data_smallcap is not None else history.get(DASHBOARD_TICKERS["data_smallcap"])
+            data_vix = data_vix if data_vix is not None else history.get(DASHBOARD_TICKERS["data_vix"])
+
+        from plotly.subplots import make_subplots
+        _plotly_extras()
+
         fig = make_subplots(
             rows=2, cols=2,
             shared_xaxes=False,
@@ -537,7 +613,7 @@ class NseVixVisualizer:
 
         vix_value = None
         if data_vix is not None and not data_vix.empty:
-            vix_value = data_vix["Close"].iloc[-1]
+            vix_value = data_vix["Close"].to_numpy()[-1]
 
         NseVixVisualizer._add_fear_and_greed_gauge(fig, vix_value, row=2, col=2)
 
@@ -553,7 +629,7 @@ class NseVixVisualizer:
             },
             height=800,
             width=1200,
-            margin=dict(l=50, r=50, t=100, b=50),
+            margin=DASHBOARD_MARGIN,
             template="plotly_white",
             showlegend=False
         )
@@ -562,7 +638,7 @@ class NseVixVisualizer:
             xref="paper", yref="paper",
             x=0.01, y=0.01,
             showarrow=False,
-            font=dict(size=10),
+            font=NOTE_FONT,
             align="left"
         )
 
@@ -1,5 +1,7 @@
 import io
+import time
 import base64
+import hashlib
 import numpy as np
 import pandas as pd
 import matplotlib
@@ -14,7 +16,7 @@ from PIL import Image, ImageDraw, ImageFont
 import plotly.io as pio
 
 
-from nse_vix import NseVixVisualizer
+from nse_vix import NseVixVisualizer, fetch_history, CACHE_DIR, CACHE_TTL
 
 
 COLORS = {
@@ -30,6 +32,16 @@ COLORS = {
 }
 
 
+def _dashboard_cache_path(history, interval):
+    """Cache file for a rendered market dashboard, keyed by interval and each index's latest bar."""
+    fingerprint = sorted(
+        (ticker, len(df), str(df.index[-1]), float(df["Close"].to_numpy()[-1]))
+        for ticker, df in history.items() if df is not None and not df.empty
+    )
+    key = hashlib.blake2b(repr((interval, fingerprint)).encode("utf-8"), digest_size=16).hexdigest()
+    return CACHE_DIR / f"dashboard_{key}.b64"
+
+
 class PortfolioVisualizer:
 
     @staticmethod
@@ -61,12 +73,17 @@ class PortfolioVisualizer:
 
         print(f"📊 Fetching Indian market data from {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}...")
 
-        # Fetch historical data for all indices
+        # Fetch historical data for all indices in one batched (disk-cached) request
+        try:
+            history = fetch_history(indices, start=start_date, end=end_date)
+        except Exception as e:
+            print(f"❌ Error retrieving indices: {str(e)}")
+            history = {}
+
         for index in indices:
-            ticker = yf.Ticker(index)
             try:
-                hist = ticker.history(start=start_date, end=end_date)
-                if not hist.empty:
+                hist = history.get(index)
+                if hist is not None and not hist.empty:
                     print(f"✅ Retrieved {index} ({len(hist)} trading days)")
                     if index == '^NSEI':
                         data_nifty = hist
@@ -83,8 +100,14 @@ class PortfolioVisualizer:
             except Exception as e:
                 print(f"❌ Error retrieving {index}: {str(e)}")
 
-        # Build dashboard using NseVixVisualizer
+        # Market-wide panels are identical for every recipient until new bars arrive — reuse the render
         interval = "YTD"
+        cache_path = _dashboard_cache_path(history, interval)
+        if CACHE_TTL > 0 and cache_path.exists() and time.time() - cache_path.stat().st_mtime < CACHE_TTL:
+            print("♻️ Reusing cached market sentiment dashboard")
+            return cache_path.read_text(encoding="ascii")
+
+        # Build dashboard using NseVixVisualizer
         fig = NseVixVisualizer.create_dashboard(
             data_nifty=data_nifty,
             data_nifty_next50=data_banknifty,
@@ -99,6 +122,13 @@ class PortfolioVisualizer:
         img_bytes = fig.to_image(format="png", width=1200, height=800, scale=2)
         encoded = base64.b64encode(img_bytes).decode('utf-8')
 
+        if CACHE_TTL > 0:
+            try:
+                CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                cache_path.write_text(encoded, encoding="ascii")
+            except OSError:
+                pass
+
         return encoded
 
 
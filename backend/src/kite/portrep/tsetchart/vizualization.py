@@ -1,27 +1,77 @@
 import io
+import os
+import time
+import pickle
 import base64
+import hashlib
 import numpy as np
 import pandas as pd
-import matplotlib
-import matplotlib.pyplot as plt
-import seaborn as sns
 import plotly.graph_objects as go
-import plotly.express as px
 from plotly.subplots import make_subplots
 from datetime import datetime, timedelta
+from pathlib import Path
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import yfinance as yf
-from PIL import Image, ImageDraw, ImageFont
 import plotly.io as pio
 
-# Set matplotlib backend to non-interactive
-matplotlib.use('Agg')
-# Set seaborn style for more professional looks
-sns.set_style('whitegrid')
-sns.set_context("notebook", font_scale=1.2)
+try:
+    # Optional: C moving-window reductions (pandas-equivalent NaN handling)
+    import bottleneck as bn
+except ImportError:
+    bn = None
 
 # Set a better default template for plotly
 pio.templates.default = "plotly_white"
 
+# One kaleido scope serves every PNG export; its renderer process stays up between calls
+try:
+    pio.kaleido.scope.default_format = "png"
+    pio.kaleido.scope.default_width = 1200
+    pio.kaleido.scope.default_height = 800
+    pio.kaleido.scope.default_scale = 2
+except AttributeError:  # kaleido not installed
+    pass
+
+# Serialize figures with orjson (native NumPy arrays, C encoder) when it is installed
+try:
+    import orjson  # noqa: F401
+    pio.json.config.default_engine = "orjson"
+except ImportError:
+    pass
+
+# Disk cache for batched Yahoo Finance downloads (seconds; 0 disables)
+CACHE_DIR = Path(__file__).parent / ".cache"
+CACHE_TTL = int(os.getenv("MARKET_DATA_CACHE_TTL", "3600"))
+
+# Per-request Yahoo Finance timeout (seconds) so one stalled ticker can't hang the dashboard
+FETCH_TIMEOUT = int(os.getenv("MARKET_DATA_TIMEOUT", "10"))
+
+# VIX levels mapped to the ends of the fear & greed scale (score 100 -> 0)
+VIX_EXTREME_GREED = 10.0
+VIX_EXTREME_FEAR = 40.0
+
+# Score band lower bounds; np.searchsorted(..., side="right") gives the SENTIMENTS index
+SENTIMENT_THRESHOLDS = np.array([25.0, 45.0, 55.0, 75.0])
+
+# (label, text color, gauge bar color) by sentiment bucket, Extreme Fear -> Extreme Greed
+SENTIMENTS = (
+    ("Extreme Fear", "#d73027", "#fc8d59"),
+    ("Fear", "#fdae61", "#fee08b"),
+    ("Neutral", "#d8c343", "#ffffbf"),
+    ("Greed", "#66bd63", "#a6d96a"),
+    ("Extreme Greed", "#1a9850", "#66bd63"),
+)
+
+# Static gauge bands (shared by every dashboard)
+GAUGE_STEPS = [
+    {"range": [0, 25], "color": "#d73027"},
+    {"range": [25, 45], "color": "#fdae61"},
+    {"range": [45, 55], "color": "#ffffbf"},
+    {"range": [55, 75], "color": "#a6d96a"},
+    {"range": [75, 100], "color": "#1a9850"}
+]
+
 # Define a professional color palette
 COLORS = {
     'primary': '#1F77B4',  # Blue
@@ -84,27 +134,135 @@ class FearAndGreed:
         else:
              return normalized * 100
 
+    # Component order for the vectorized calculate(); VIX and safe-haven demand read inverted
+    COMPONENTS = ('vix', 'momentum', 'safe_haven', 'volume')
+    INVERTED = np.array([True, False, True, False])
+
     def calculate(self, vix, momentum, safe_haven_ratio, volume_change):
         """
         Calculate the weighted Fear & Greed Index.
+        Inputs may be scalars or equal-length arrays (e.g. a daily history); all four
+        components are normalized and weighted in one NumPy pass instead of per value.
         """
-        norm_vix = self._normalize(vix, 'vix')
-        norm_momentum = self._normalize(momentum, 'momentum')
-        norm_safe_haven = self._normalize(safe_haven_ratio, 'safe_haven')
-        # For safe haven, higher ratio might mean more fear, let's invert
-        norm_safe_haven = 100 - norm_safe_haven 
-        norm_volume = self._normalize(volume_change, 'volume')
+        # (4, ...) stack of component values; bounds/weights shaped (4, 1, ...) to broadcast
+        values = np.stack(np.broadcast_arrays(
+            *(np.asarray(v, dtype=float) for v in (vix, momentum, safe_haven_ratio, volume_change))
+        ))
+        col = (-1,) + (1,) * (values.ndim - 1)
+        lo, hi = np.array([self.ranges[k] for k in self.COMPONENTS], dtype=float).T
+        lo, hi = lo.reshape(col), hi.reshape(col)
+        weights = np.array([self.weights[k] for k in self.COMPONENTS], dtype=float)
+
+        normalized = (np.clip(values, lo, hi) - lo) / (hi - lo) * 100
+        # For VIX, higher value means more fear; for safe haven, a higher ratio means more fear
+        normalized = np.where(self.INVERTED.reshape(col), 100 - normalized, normalized)
         # For volume, extreme high volume might mean panic/fear, let's consider this.
         # This simple normalization doesn't capture extremes well. Needs improvement.
-        
-        # Weighted average
-        index = (norm_vix * self.weights['vix'] +
-                 norm_momentum * self.weights['momentum'] +
-                 norm_safe_haven * self.weights['safe_haven'] +
-                 norm_volume * self.weights['volume'])
-                 
-        # Ensure the final index is between 0 and 100
-        return np.clip(index, 0, 100) 
+
+        # Weighted average, then ensure the final index is between 0 and 100
+        index = np.clip(np.tensordot(weights, normalized, axes=1), 0, 100)
+        return index[()] if index.ndim == 0 else index
+
+def fear_greed_score(vix_value):
+    """
+    Map VIX to a 0-100 fear & greed score and its SENTIMENTS index.
+    Accepts a scalar or an array of VIX values.
+    """
+    # np.interp clamps outside [VIX_EXTREME_GREED, VIX_EXTREME_FEAR], so no branches are needed
+    score = np.interp(vix_value, (VIX_EXTREME_GREED, VIX_EXTREME_FEAR), (100.0, 0.0))
+    idx = np.searchsorted(SENTIMENT_THRESHOLDS, score, side="right")
+    if np.ndim(score) == 0:
+        return float(score), int(idx)
+    return score, idx
+
+@lru_cache(maxsize=1)
+def warm_up_renderer():
+    """Start kaleido's renderer process (once per process) ahead of the first real export."""
+    try:
+        go.Figure().to_image(format="png", width=10, height=10)
+    except Exception as e:
+        print(f"Warning: kaleido warm-up failed: {str(e)}")
+
+def fetch_history(tickers, start, end, interval="1d"):
+    """
+    Download OHLCV for all tickers with a single threaded yf.download call.
+
+    Results are pickled under CACHE_DIR keyed by (tickers, start, end, interval)
+    and reused for CACHE_TTL seconds.
+
+    Returns:
+        dict: ticker -> DataFrame (empty when Yahoo returned no rows)
+    """
+    tickers = list(dict.fromkeys(tickers))
+    if not tickers:
+        return {}
+
+    key = hashlib.blake2b(
+        repr((tickers, str(pd.Timestamp(start).date()), str(pd.Timestamp(end).date()), interval)).encode("utf-8"),
+        digest_size=16,
+    ).hexdigest()
+    path = CACHE_DIR / f"{key}.pkl"
+    if CACHE_TTL > 0 and path.exists() and time.time() - path.stat().st_mtime < CACHE_TTL:
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            pass
+
+    raw = yf.download(tickers=tickers, start=start, end=end, interval=interval, group_by="ticker",
+                      threads=True, progress=False, auto_adjust=True, timeout=FETCH_TIMEOUT)
+
+    history = {}
+    for ticker in tickers:
+        if isinstance(raw.columns, pd.MultiIndex):
+            hist = raw[ticker] if ticker in raw.columns.get_level_values(0) else pd.DataFrame()
+        else:
+            hist = raw if len(tickers) == 1 else pd.DataFrame()
+        history[ticker] = hist.dropna(how="all")
+
+    if CACHE_TTL > 0:
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(path, "wb") as f:
+                pickle.dump(history, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            pass
+    return history
+
+def _moving_mean(values, window):
+    """
+    O(n) trailing moving average, NaN until `window` valid points are in the window
+    (same result as Series.rolling(window).mean()).
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if bn is not None:
+        return bn.move_mean(values, window=window, min_count=window)
+
+    # Running sums: window sum = csum[i] - csum[i - window]; NaNs are counted, not summed
+    valid = ~np.isnan(values)
+    csum = np.concatenate(([0.0], np.cumsum(np.where(valid, values, 0.0))))
+    ccount = np.concatenate(([0], np.cumsum(valid)))
+    out = np.full(len(values), np.nan)
+    sums = csum[window:] - csum[:-window]
+    full = (ccount[window:] - ccount[:-window]) == window
+    out[window - 1:] = np.where(full, sums / window, np.nan)
+    return out
+
+def _xaxis(index):
+    """
+    Date axis values as a datetime64[ms] array (tz-aware indexes keep their wall-clock time),
+    so figures serialize one array instead of a Timestamp per point.
+    """
+    if not isinstance(index, pd.DatetimeIndex):
+        return index
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.to_numpy(dtype="datetime64[ms]")
+
+def _add_series_trace(fig, trace, x, y, **kwargs):
+    """Add a time-series trace with its x/y data."""
+    trace.update(x=x, y=y)
+    fig.add_trace(trace, **kwargs)
 
 # Define common figure styling
 def apply_common_style(fig, title=None, height=800):
@@ -147,13 +305,11 @@ def apply_common_style(fig, title=None, height=800):
 # Helper function: Add S&P 500 chart
 def _add_sp500_chart(fig, hist_sp, interval="1mo", row=2, col=2):
     """Add standalone S&P 500 chart"""
-    fig.add_trace(go.Scatter(
-        x=hist_sp.index,
-        y=hist_sp['Close'],
+    _add_series_trace(fig, go.Scatter(
         name="S&P 500",
         mode='lines',
         line=dict(color=COLORS['primary'], width=2),
-    ), row=row, col=col)
+    ), _xaxis(hist_sp.index), hist_sp['Close'].to_numpy(), row=row, col=col)
     
     fig.update_yaxes(title=dict(
         text="S&P 500 Index Value",
@@ -192,39 +348,38 @@ def _add_sp500_vix_chart(fig, data_sp500=None, data_vix=None, row=1, col=1):
         )
         return
     
-    # Align the data to have same dates
-    min_date = max(data_sp500.index.min(), data_vix.index.min())
-    max_date = min(data_sp500.index.max(), data_vix.index.max())
+    # Align the data to have same dates (indexes are date-sorted: first/last are min/max)
+    min_date = max(data_sp500.index[0], data_vix.index[0])
+    max_date = min(data_sp500.index[-1], data_vix.index[-1])
     
-    sp500_aligned = data_sp500.loc[(data_sp500.index >= min_date) & (data_sp500.index <= max_date)]
-    vix_aligned = data_vix.loc[(data_vix.index >= min_date) & (data_vix.index <= max_date)]
+    # Binary-search the common window instead of materializing boolean masks
+    sp500_aligned = data_sp500.iloc[data_sp500.index.searchsorted(min_date, side="left"):
+                                    data_sp500.index.searchsorted(max_date, side="right")]
+    vix_aligned = data_vix.iloc[data_vix.index.searchsorted(min_date, side="left"):
+                                data_vix.index.searchsorted(max_date, side="right")]
+    sp500_close = sp500_aligned["Close"].to_numpy()
+    vix_close = vix_aligned["Close"].to_numpy()
     
     # Calculate percentage changes for both indices over the aligned period
-    if len(sp500_aligned) > 0:
-        sp500_pct_change = ((sp500_aligned["Close"].iloc[-1] - sp500_aligned["Close"].iloc[0]) / 
-                           sp500_aligned["Close"].iloc[0] * 100)
-    else:
-        sp500_pct_change = 0
+    sp500_pct_change = ((sp500_close[-1] - sp500_close[0]) /
+                        sp500_close[0] * 100) if len(sp500_close) > 0 else 0
 
-    if len(vix_aligned) > 0:
-        vix_pct_change = ((vix_aligned["Close"].iloc[-1] - vix_aligned["Close"].iloc[0]) / 
-                         vix_aligned["Close"].iloc[0] * 100)
-    else:
-        vix_pct_change = 0
+    vix_pct_change = ((vix_close[-1] - vix_close[0]) /
+                      vix_close[0] * 100) if len(vix_close) > 0 else 0
         
     # Define line colors
     sp500_color = "#1f77b4" # Blue
     vix_color = "#d62728"   # Red
 
     # Add S&P 500 trace to primary y-axis
-    fig.add_trace(
+    _add_series_trace(
+        fig,
         go.Scatter(
-            x=sp500_aligned.index,
-            y=sp500_aligned["Close"],
             name="S&P 500",
             line=dict(color=sp500_color, width=2),
             showlegend=False
         ),
+        _xaxis(sp500_aligned.index), sp500_close,
         row=row, col=col,
         secondary_y=False
     )
@@ -233,7 +388,7 @@ def _add_sp500_vix_chart(fig, data_sp500=None, data_vix=None, row=1, col=1):
     fig.add_annotation(
         x=0.02, y=0.97,
         xref="x domain", yref="y domain",
-        text=f"S&P 500: {sp500_aligned['Close'].iloc[-1]:.2f} ({sp500_pct_change:+.2f}%) ({min_date.strftime('%b %d')} to {max_date.strftime('%b %d')})",
+        text=f"S&P 500: {sp500_close[-1]:.2f} ({sp500_pct_change:+.2f}%) ({min_date.strftime('%b %d')} to {max_date.strftime('%b %d')})",
         showarrow=False,
         font=dict(size=12, color=sp500_color), # Match line color
         align="left",
@@ -245,14 +400,14 @@ def _add_sp500_vix_chart(fig, data_sp500=None, data_vix=None, row=1, col=1):
     )
     
     # Add VIX trace to secondary y-axis
-    fig.add_trace(
+    _add_series_trace(
+        fig,
         go.Scatter(
-            x=vix_aligned.index,
-            y=vix_aligned["Close"],
             name="VIX",
             line=dict(color=vix_color, width=2),
             showlegend=False
         ),
+        _xaxis(vix_aligned.index), vix_close,
         row=row, col=col,
         secondary_y=True
     )
@@ -261,7 +416,7 @@ def _add_sp500_vix_chart(fig, data_sp500=None, data_vix=None, row=1, col=1):
     fig.add_annotation(
         x=0.98, y=0.97,
         xref="x domain", yref="y domain",
-        text=f"VIX: {vix_aligned['Close'].iloc[-1]:.2f} ({vix_pct_change:+.2f}%)",
+        text=f"VIX: {vix_close[-1]:.2f} ({vix_pct_change:+.2f}%)",
         showarrow=False,
         font=dict(size=12, color=vix_color), # Match line color
         align="right",
@@ -312,21 +467,19 @@ def _add_indices_performance_chart(fig, indices_data, row=1, col=1):
         )
         return
         
-        # Calculate percentage changes
-    changes = {}
-    start_dates = {}
-    end_dates = {}
+    # One pass for the first/last closes, then the percentage changes in one NumPy op
+    indices = []
+    firsts = []
+    latests = []
     
     for index_name, df in indices_data.items():
         if len(df) >= 2:
-            latest = df["Close"].iloc[-1]
-            first = df["Close"].iloc[0]
-            pct_change = ((latest - first) / first) * 100
-            changes[index_name] = pct_change
-            start_dates[index_name] = df.index[0]
-            end_dates[index_name] = df.index[-1]
-    
-    if not changes:
+            close = df["Close"].to_numpy()
+            indices.append(index_name)
+            firsts.append(close[0])
+            latests.append(close[-1])
+    
+    if not indices:
         fig.add_annotation(
             text="Insufficient data to calculate changes",
             xref="x domain", yref="y domain",
@@ -336,21 +489,9 @@ def _add_indices_performance_chart(fig, indices_data, row=1, col=1):
         )
         return
     
-    # Find common time period for all indices (still needed for context if required elsewhere)
-    common_start = None
-    common_end = None
+    firsts = np.asarray(firsts, dtype=float)
+    values = (np.asarray(latests, dtype=float) - firsts) / firsts * 100
     
-    for name in changes.keys():
-        if common_start is None:
-            common_start = start_dates[name]
-        else:
-            common_start = max(common_start, start_dates[name])
-            
-        if common_end is None:
-            common_end = end_dates[name]
-        else:
-            common_end = min(common_end, end_dates[name])
-            
     # Define consistent colors (same as comparison chart)
     consistent_colors = {
         "S&P 500": "#1f77b4",      # Blue
@@ -359,14 +500,10 @@ def _add_indices_performance_chart(fig, indices_data, row=1, col=1):
         "Russell 2000": "#ff7f0e" # Orange
     }
     
-    # Create sorted bar chart data
-    indices = list(changes.keys())
-    values = list(changes.values())
-    
-    # Sort by values (descending)
-    sorted_data = sorted(zip(indices, values), key=lambda item: item[1], reverse=True)
-    sorted_indices = [item[0] for item in sorted_data]
-    sorted_values = [item[1] for item in sorted_data]
+    # Sort by values (descending; stable so ties keep input order)
+    order = np.argsort(-values, kind="stable")
+    sorted_indices = [indices[i] for i in order]
+    sorted_values = values[order].tolist()
     
     # Assign colors based on index name
     sorted_colors = [consistent_colors.get(name, "#7f7f7f") for name in sorted_indices]
@@ -426,47 +563,47 @@ def _add_historical_chart(fig, data_sp500=None, row=1, col=1):
         )
         return
     
-    # Calculate moving averages if enough data
-    if len(data_sp500) > 50:
-        data_sp500['MA50'] = data_sp500['Close'].rolling(window=50).mean()
-    if len(data_sp500) > 200:
-        data_sp500['MA200'] = data_sp500['Close'].rolling(window=200).mean()
+    # Calculate moving averages if enough data (local arrays; the caller's frame is left untouched)
+    close = data_sp500['Close'].to_numpy()
+    dates = _xaxis(data_sp500.index)  # shared by the price and MA traces
+    ma50 = _moving_mean(close, 50) if len(close) > 50 else None
+    ma200 = _moving_mean(close, 200) if len(close) > 200 else None
     
     # Add S&P 500 price line
-    fig.add_trace(
+    _add_series_trace(
+        fig,
         go.Scatter(
-            x=data_sp500.index,
-            y=data_sp500["Close"],
             name="S&P 500",
             line=dict(color="blue", width=2),
             showlegend=False
         ),
+        dates, close,
         row=row, col=col
     )
     
     # Add 50-day moving average if available
-    if 'MA50' in data_sp500.columns:
-        fig.add_trace(
+    if ma50 is not None:
+        _add_series_trace(
+            fig,
             go.Scatter(
-                x=data_sp500.index,
-                y=data_sp500["MA50"],
                 name="50-day MA",
                 line=dict(color="orange", width=1.5, dash="dash"),
                 showlegend=False
             ),
+            dates, ma50,
             row=row, col=col
         )
     
     # Add 200-day moving average if available
-    if 'MA200' in data_sp500.columns:
-        fig.add_trace(
+    if ma200 is not None:
+        _add_series_trace(
+            fig,
             go.Scatter(
-                x=data_sp500.index,
-                y=data_sp500["MA200"],
                 name="200-day MA",
                 line=dict(color="red", width=1.5, dash="dash"),
                 showlegend=False
             ),
+            dates, ma200,
             row=row, col=col
         )
     
@@ -522,37 +659,8 @@ def _add_fear_and_greed_gauge(fig, vix_value=None, row=1, col=1):
         )
         return
     
-    vix_extreme_greed = 10
-    vix_extreme_fear = 40
-    vix_clamped = max(vix_extreme_greed, min(vix_value, vix_extreme_fear))
-    
-    if vix_value <= vix_extreme_greed:
-        fear_greed_value = 100
-    elif vix_value >= vix_extreme_fear:
-        fear_greed_value = 0
-    else:
-        fear_greed_value = 100 - ((vix_clamped - vix_extreme_greed) / (vix_extreme_fear - vix_extreme_greed) * 100)
-    
-    if fear_greed_value >= 75:
-        sentiment = "Extreme Greed"
-        color = "#1a9850"
-        bar_color = "#66bd63"
-    elif fear_greed_value >= 55:
-        sentiment = "Greed"
-        color = "#66bd63"
-        bar_color = "#a6d96a"
-    elif fear_greed_value >= 45:
-        sentiment = "Neutral"
-        color = "#d8c343"
-        bar_color = "#ffffbf"
-    elif fear_greed_value >= 25:
-        sentiment = "Fear"
-        color = "#fdae61"
-        bar_color = "#fee08b"
-    else:
-        sentiment = "Extreme Fear"
-        color = "#d73027"
-        bar_color = "#fc8d59"
+    fear_greed_value, sentiment_idx = fear_greed_score(vix_value)
+    sentiment, color, bar_color = SENTIMENTS[sentiment_idx]
 
     score_font_size = 30
     sentiment_font_size = score_font_size
@@ -565,13 +673,7 @@ def _add_fear_and_greed_gauge(fig, vix_value=None, row=1, col=1):
             gauge={
                 "axis": {"range": [0, 100], "tickmode": "array", "tickvals": [0, 25, 50, 75, 100], "ticktext": ["", "", "", "", ""], "tickfont": {"size": 10}},
                 "bar": {"color": bar_color, "thickness": 0.3},
-                "steps": [
-                    {"range": [0, 25], "color": "#d73027"},
-                    {"range": [25, 45], "color": "#fdae61"},
-                    {"range": [45, 55], "color": "#ffffbf"},
-                    {"range": [55, 75], "color": "#a6d96a"},
-                    {"range": [75, 100], "color": "#1a9850"}
-                ],
+                "steps": GAUGE_STEPS,
                 "threshold": {"line": {"color": "black", "width": 4}, "thickness": 0.9, "value": fear_greed_value},
                 "bgcolor": "rgba(255, 255, 255, 0.7)",
                 "borderwidth": 1,
@@ -685,16 +787,15 @@ def _add_market_comparison_chart(fig, indices_data, row=1, col=1):
         )
         return
     
-    # Calculate normalized performance for each index
+    # Calculate normalized performance for each index as (dates, values) arrays
     for name, df in indices_data.items():
         if df is not None and not df.empty:
-            # Filter data starting from reference date
-            filtered_df = df[df.index >= reference_date]
-            if not filtered_df.empty:
+            # Date-sorted index: binary-search the reference date instead of a boolean mask copy
+            pos = df.index.searchsorted(reference_date, side="left")
+            if pos < len(df):
                 # Normalize to 100 at start date
-                reference_value = filtered_df['Close'].iloc[0]
-                normed_series = (filtered_df['Close'] / reference_value) * 100
-                normed_data[name] = normed_series
+                close = df['Close'].to_numpy()[pos:]
+                normed_data[name] = (_xaxis(df.index[pos:]), close * (100.0 / close[0]))
     
     # Define consistent colors used across charts
     consistent_colors = {
@@ -704,37 +805,36 @@ def _add_market_comparison_chart(fig, indices_data, row=1, col=1):
         "Russell 2000": "#ff7f0e" # Orange
     }
     
-    # Determine the last date for plotting
-    last_date = None
+    # Determine the plotted date span on the same (tz-naive) axis values as the traces;
+    # the series that set reference_date starts exactly on it (every stored series is non-empty)
+    first_date = last_date = None
     if normed_data:
-        valid_series = [s for s in normed_data.values() if not s.empty]
-        if valid_series:
-            last_date = max(series.index[-1] for series in valid_series)
+        first_date = min(dates[0] for dates, _ in normed_data.values())
+        last_date = max(dates[-1] for dates, _ in normed_data.values())
 
     # Plot each normalized index
-    for name, series in normed_data.items():
-        if not series.empty:
-            color = consistent_colors.get(name, "#7f7f7f")  # Default to gray if name not in colors dict
-            
-            fig.add_trace(
-                go.Scatter(
-                    x=series.index,
-                    y=series,
-                    name=name, # Legend name
-                    line=dict(color=color, width=2),
-                    hovertemplate=f"{name}: %{{y:.2f}}%<extra></extra>",
-                    legendgroup=name, # Group legends if needed later
-                    showlegend=True # Show individual lines in legend
-                ),
-                row=row, col=col
-            )
+    for name, (dates, normed) in normed_data.items():
+        color = consistent_colors.get(name, "#7f7f7f")  # Default to gray if name not in colors dict
+        
+        _add_series_trace(
+            fig,
+            go.Scatter(
+                name=name, # Legend name
+                line=dict(color=color, width=2),
+                hovertemplate=f"{name}: %{{y:.2f}}%<extra></extra>",
+                legendgroup=name, # Group legends if needed later
+                showlegend=True # Show individual lines in legend
+            ),
+            dates, normed,
+            row=row, col=col
+        )
     
     # Add reference line at 100
-    if reference_date and last_date:
+    if first_date is not None and last_date is not None:
         fig.add_shape(
             type="line",
-            x0=reference_date,
-            x1=last_date,
+            x0=pd.Timestamp(first_date),
+            x1=pd.Timestamp(last_date),
             y0=100,
             y1=100,
             line=dict(color="black", width=1, dash="dash"),
@@ -754,28 +854,16 @@ def _add_market_comparison_chart(fig, indices_data, row=1, col=1):
         row=row, col=col
     )
 
-def create_dashboard(data_sp500=None, data_nasdaq=None, data_dji=None, data_rut=None, data_vix=None, interval="YTD"):
-    """Create a dashboard with market data.
-    
-    Args:
-        data_sp500 (pd.DataFrame, optional): S&P 500 data.
-        data_nasdaq (pd.DataFrame, optional): NASDAQ data.
-        data_dji (pd.DataFrame, optional): Dow Jones Industrial Average data.
-        data_rut (pd.DataFrame, optional): Russell 2000 data.
-        data_vix (pd.DataFrame, optional): VIX data.
-        interval (str, optional): Data interval (e.g., "YTD", "1mo"). Defaults to "YTD".
-        
-    Returns:
-        plotly.graph_objects.Figure: Dashboard figure.
-    """
-    # Create 2x2 subplot
-    fig = make_subplots(
+@lru_cache(maxsize=1)
+def _dashboard_skeleton():
+    """2x2 subplot layout shared by every dashboard; built once, copied per call."""
+    return make_subplots(
         rows=2, cols=2,
         shared_xaxes=False,
         vertical_spacing=0.12,
         horizontal_spacing=0.08,
         subplot_titles=(
-            f"Major Indices Performance ({interval})",
+            "Major Indices Performance",  # interval appended per dashboard
             "S&P 500 vs VIX",
             "Indices Relative Performance Comparison",
             "Market Fear & Greed Index"
@@ -785,6 +873,24 @@ def create_dashboard(data_sp500=None, data_nasdaq=None, data_dji=None, data_rut=
             [{"type": "xy"}, {"type": "domain"}]
         ]
     )
+
+def create_dashboard(data_sp500=None, data_nasdaq=None, data_dji=None, data_rut=None, data_vix=None, interval="YTD"):
+    """Create a dashboard with market data.
+    
+    Args:
+        data_sp500 (pd.DataFrame, optional): S&P 500 data.
+        data_nasdaq (pd.DataFrame, optional): NASDAQ data.
+        data_dji (pd.DataFrame, optional): Dow Jones Industrial Average data.
+        data_rut (pd.DataFrame, optional): Russell 2000 data.
+        data_vix (pd.DataFrame, optional): VIX data.
+        interval (str, optional): Data interval (e.g., "YTD", "1mo"). Defaults to "YTD".
+        
+    Returns:
+        plotly.graph_objects.Figure: Dashboard figure.
+    """
+    # Create 2x2 subplot: copy the cached skeleton (go.Figure keeps its subplot grid)
+    fig = go.Figure(_dashboard_skeleton())
+    fig.layout.annotations[0].text = f"Major Indices Performance ({interval})"
     
     # Add bar chart with indices performance
     indices_data = {}
@@ -876,29 +982,33 @@ def generate_market_sentiment_dashboard(indices=None):
     
     print(f"Getting market data from {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}...")
     
-    # Process all indices to get historical data
-    for index in indices:
-        ticker = yf.Ticker(index)
-        # Get year-to-date data
+    # One batched (and disk-cached) download for all indices, then split in memory;
+    # kaleido's renderer cold-starts in parallel so the PNG export below doesn't pay for it
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        warm_up = executor.submit(warm_up_renderer)
         try:
-            hist = ticker.history(start=start_date, end=end_date)
-            
-            if not hist.empty:
-                print(f"Successfully retrieved {index} data, total of {len(hist)} trading days")
-                if index == '^GSPC':
-                    data_sp500 = hist
-                elif index == '^IXIC':
-                    data_nasdaq = hist
-                elif index == '^DJI':
-                    data_dji = hist
-                elif index == '^RUT':
-                    data_rut = hist
-                elif index == '^VIX':
-                    data_vix = hist
-            else:
-                print(f"Warning: {index} did not return data")
+            history = fetch_history(indices, start_date, end_date)
         except Exception as e:
-            print(f"Error retrieving {index} data: {str(e)}")
+            print(f"Error retrieving market data: {str(e)}")
+            history = {}
+        warm_up.result()
+    
+    for index in indices:
+        hist = history.get(index)
+        if hist is not None and not hist.empty:
+            print(f"Successfully retrieved {index} data, total of {len(hist)} trading days")
+            if index == '^GSPC':
+                data_sp500 = hist
+            elif index == '^IXIC':
+                data_nasdaq = hist
+            elif index == '^DJI':
+                data_dji = hist
+            elif index == '^RUT':
+                data_rut = hist
+            elif index == '^VIX':
+                data_vix = hist
+        else:
+            print(f"Warning: {index} did not return data")
     
     # Create dashboard using our improved layout
     interval = "YTD"  # Year-to-Date
@@ -911,8 +1021,8 @@ def generate_market_sentiment_dashboard(indices=None):
         interval=interval
     )
     
-    # Convert to image and return as base64
-    img_bytes = fig.to_image(format="png", width=1200, height=800, scale=2)
+    # Convert to image (on the warm scope) and return as base64
+    img_bytes = pio.to_image(fig, format="png", width=1200, height=800, scale=2)
     encoded = base64.b64encode(img_bytes).decode('utf-8')
     
     return encoded
@@ -927,6 +1037,9 @@ def generate_portfolio_tracking(symbols=None):
     Returns:
         str: base64 encoded image
     """
+    # Pillow is only needed to compose this report's chart + table image
+    from PIL import Image, ImageDraw
+
     if symbols is None:
         symbols = ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'NVDA']
     